@@ -4,16 +4,60 @@ Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting
 
 Example usage:
     python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> --original <office_file> --level 1
 """
 
 import argparse
-import shutil
-import subprocess
+import io
+import struct
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
-from pathlib import Path
+import zlib
+from pathlib import Path, PurePosixPath
+
+import lxml.etree
+from office_pool import convert_document
+from unpack import LAZY_MANIFEST
+
+# Parts that are condensed while packing
+XML_SUFFIXES = (".xml", ".rels")
+
+# Declaration written in front of every condensed part
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>'
+
+# Media formats that are already compressed and gain nothing from deflate
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".jpe",
+    ".gif",
+    ".webp",
+    ".wdp",
+    ".jxr",
+    ".mp3",
+    ".m4a",
+    ".aac",
+    ".wma",
+    ".ogg",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".wmv",
+    ".webm",
+    ".zip",
+    ".gz",
+    ".docx",
+    ".docm",
+    ".xlsx",
+    ".xlsm",
+    ".pptx",
+    ".pptm",
+}
+
+# Chunk size used when copying raw member data
+COPY_CHUNK_SIZE = 1024 * 1024
 
 
 def main():
@@ -21,11 +65,28 @@ def main():
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="0-9",
+        help="Deflate level for XML and other compressible parts (default: 6)",
+    )
+    parser.add_argument(
+        "--original",
+        help="Original Office file; parts that are unchanged since it are "
+        "copied from it without recompressing",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            compresslevel=args.level,
+            original=args.original,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +103,23 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir, output_file, validate=False, compresslevel=None, original=None
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    Already-compressed media (see STORED_EXTENSIONS) is stored as-is, every
+    other part is deflated at compresslevel. If original is given, non-XML
+    parts whose content is unchanged since the original archive (same size
+    and CRC-32) are copied from it byte for byte, without decompressing or
+    recompressing them.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        compresslevel: Deflate level 0-9 (default: None, zlib's default)
+        original: Path to the Office file input_dir was unpacked from
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,32 +132,146 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    # Stream each part from the input directory straight into the archive.
+    # XML parts are condensed in memory on the way, so the input directory is
+    # never copied or modified and memory is bounded by the largest part.
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_resolved = output_file.resolve()
+    source = zipfile.ZipFile(original) if original else None
+    try:
+        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for f in input_dir.rglob("*"):
+                if not f.is_file() or f.resolve() == output_resolved:
+                    continue
+                if f.parent == input_dir and f.name == LAZY_MANIFEST:
+                    continue
+                arcname = f.relative_to(input_dir).as_posix()
+                if f.name.endswith(XML_SUFFIXES):
+                    buffer = io.BytesIO()
+                    write_condensed_xml(f, buffer)
+                    zf.writestr(
+                        zipfile.ZipInfo.from_file(f, arcname),
+                        buffer.getvalue(),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                        compresslevel=compresslevel,
+                    )
+                    continue
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+                if source is not None:
+                    info = _unchanged_member(source, arcname, f)
+                    if info is not None:
+                        zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                        copy_raw_member(zf, source, info, zinfo)
+                        continue
 
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
+                zf.write(
+                    f,
+                    arcname,
+                    compress_type=compression_for(arcname),
+                    compresslevel=compresslevel,
+                )
+    finally:
+        if source is not None:
+            source.close()
 
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def compression_for(name):
+    """Return the zip compression method for a member of a packed file."""
+    if PurePosixPath(name).suffix.lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def can_copy_raw(info):
+    """Check whether copy_raw_member can copy a member.
+
+    Encrypted members, compression methods other than stored and deflate, and
+    ZIP64 members are excluded; recompress those instead.
+    """
+    if info.flag_bits & 0x1 or info.compress_type not in (
+        zipfile.ZIP_STORED,
+        zipfile.ZIP_DEFLATED,
+    ):
+        return False
+    return max(info.file_size, info.compress_size) < zipfile.ZIP64_LIMIT
+
+
+def copy_raw_member(zf, source, info, zinfo):
+    """Copy a member's compressed bytes from source into zf unchanged.
+
+    zipfile has no public API for this, so the local header is written from
+    zinfo and the compressed data is streamed after it, which is what
+    ZipFile.writestr does internally once the data is compressed. Check the
+    member with can_copy_raw first.
+
+    Args:
+        zf: ZipFile open for writing
+        source: ZipFile open for reading that holds the member
+        info: ZipInfo of the member in source
+        zinfo: ZipInfo giving the name, date and attributes of the copy; its
+            compression, CRC and sizes are taken from info
+    """
+    # Locate the compressed data behind the member's local file header
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(zipfile.sizeFileHeader)
+    if header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.fp.seek(
+        info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+    )
+
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = info.compress_size
+
+    with zf._lock:
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader(zip64=False))
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.fp.read(min(remaining, COPY_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+            zf.fp.write(chunk)
+            remaining -= len(chunk)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf._didModify = True
+
+
+def _unchanged_member(source, arcname, path):
+    """Return the ZipInfo of arcname in source if path still has its content.
+
+    Only the CRC-32 of the file on disk is computed; the member itself is
+    never decompressed. Members copy_raw_member cannot copy are never reused.
+    """
+    try:
+        info = source.getinfo(arcname)
+    except KeyError:
+        return None
+    if not can_copy_raw(info):
+        return None
+    if path.stat().st_size != info.file_size:
+        return None
+
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return info if crc == info.CRC else None
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -100,29 +285,12 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            convert_document(doc_path, temp_dir, filter_name, timeout=10)
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -132,27 +300,65 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    tree = parse_condensed_xml(xml_file)
+
+    # Write back the condensed XML
+    with open(xml_file, "wb") as f:
+        f.write(XML_DECLARATION)
+        tree.write(f, encoding="UTF-8", xml_declaration=False)
 
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
+
+def write_condensed_xml(xml_file, dest):
+    """Condense an XML part and write it to a binary stream (e.g. a zip entry)."""
+    tree = parse_condensed_xml(xml_file)
+    dest.write(XML_DECLARATION)
+    tree.write(dest, encoding="UTF-8", xml_declaration=False)
+
+
+def parse_condensed_xml(xml_file):
+    """Parse an XML part, stripping pretty-printing whitespace and comments.
+
+    Elements are condensed as soon as iterparse finishes them, so the tree is
+    only walked once. Whitespace-only text and comments are removed from every
+    element except text elements (w:t, a:t, ...), whose content is preserved.
+
+    Returns:
+        lxml.etree._ElementTree: The condensed tree
+    """
+    context = lxml.etree.iterparse(
+        str(xml_file),
+        events=("end",),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    for _, element in context:
         # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
+        if element.prefix is not None and element.tag.endswith("}t"):
             continue
+        _condense_element(element)
+    return context.root.getroottree()
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+def _condense_element(element):
+    """Remove whitespace-only text and comment children of a single element."""
+    if element.text is not None and not element.text.strip():
+        element.text = None
+
+    for child in list(element):
+        tail = child.tail
+        if tail is not None and not tail.strip():
+            tail = child.tail = None
+
+        if child.tag is lxml.etree.Comment:
+            # Removing a node drops its tail, so keep real text after comments
+            previous = child.getprevious()
+            element.remove(child)
+            if tail:
+                if previous is not None:
+                    previous.tail = (previous.tail or "") + tail
+                else:
+                    element.text = (element.text or "") + tail
 
 
 if __name__ == "__main__":
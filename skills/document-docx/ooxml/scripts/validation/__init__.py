@@ -4,12 +4,20 @@ Validation modules for Word document processing.
 
 from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
+from .incremental import BaselineHashes, ValidationState
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .schema_cache import SchemaRegistry, schema_registry
+from .tree_pool import TreePool
 
 __all__ = [
+    "BaselineHashes",
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "SchemaRegistry",
+    "schema_registry",
+    "TreePool",
+    "ValidationState",
 ]
@@ -0,0 +1,129 @@
+"""
+Read-only access to the original Office file used as a validation baseline.
+
+The original may also be a directory holding unpacked baseline parts.
+"""
+
+import zipfile
+from pathlib import Path, PurePath, PurePosixPath
+
+
+class OriginalBaseline:
+    """Baseline view of the original .docx/.pptx/.xlsx archive.
+
+    The archive is opened once and individual members are read straight from
+    the zip into memory on demand, so validating N parts never extracts the
+    whole archive to disk. Per-part results derived from the original (such
+    as its XSD errors) are memoized so each part is only checked once.
+
+    If original_file is a directory, parts are read from the files below it
+    instead; parts without a file there are treated as missing from the original.
+    """
+
+    def __init__(self, original_file):
+        self.original_file = Path(original_file)
+        self._zip = None
+        self._members = None
+        self._part_errors = {}
+
+    def _open(self):
+        """Open the archive and index its members on first use."""
+        if self._members is None and self.original_file.is_dir():
+            self._members = {
+                path.relative_to(self.original_file).as_posix(): path
+                for path in self.original_file.rglob("*")
+                if path.is_file()
+            }
+        elif self._zip is None and self._members is None:
+            self._zip = zipfile.ZipFile(self.original_file, "r")
+            self._members = {
+                info.filename: info
+                for info in self._zip.infolist()
+                if not info.is_dir()
+            }
+        return self._zip
+
+    def close(self):
+        """Close the underlying archive."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        self._members = None
+
+    def names(self):
+        """Return the member names of the original archive."""
+        self._open()
+        return list(self._members)
+
+    def has_part(self, relative_path):
+        """Check whether a part exists in the original archive."""
+        self._open()
+        return self._member_name(relative_path) in self._members
+
+    def read(self, relative_path):
+        """Read a single part from the original archive.
+
+        Args:
+            relative_path: Part path relative to the package root (str or Path)
+
+        Returns:
+            bytes: The part content, or None if the part does not exist
+        """
+        zf = self._open()
+        info = self._members.get(self._member_name(relative_path))
+        if info is None:
+            return None
+        if zf is None:
+            return info.read_bytes()
+        return zf.read(info)
+
+    def open(self, relative_path):
+        """Open a single part of the original for streaming reads.
+
+        Args:
+            relative_path: Part path relative to the package root (str or Path)
+
+        Returns:
+            A binary file object (to be closed by the caller), or None if the
+            part does not exist
+        """
+        zf = self._open()
+        info = self._members.get(self._member_name(relative_path))
+        if info is None:
+            return None
+        if zf is None:
+            return info.open("rb")
+        return zf.open(info)
+
+    def part_errors(self, relative_path, validate):
+        """Return memoized validation errors for a part of the original file.
+
+        Args:
+            relative_path: Part path relative to the package root
+            validate: Callable (relative_path, content) -> (is_valid, errors)
+                used to compute the errors on first request
+
+        Returns:
+            set: Error messages for the part (empty if the part is missing)
+        """
+        name = self._member_name(relative_path)
+        if name not in self._part_errors:
+            content = self.read(name)
+            if content is None:
+                # Part didn't exist in original, so no original errors
+                errors = set()
+            else:
+                _, errors = validate(PurePosixPath(name), content)
+            self._part_errors[name] = errors or set()
+        return self._part_errors[name]
+
+    @staticmethod
+    def _member_name(relative_path):
+        """Convert a relative path to a zip member name."""
+        if isinstance(relative_path, PurePath):
+            return relative_path.as_posix()
+        return str(relative_path).replace("\\", "/")
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
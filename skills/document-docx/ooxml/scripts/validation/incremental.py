@@ -0,0 +1,133 @@
+"""
+Validation state carried across runs so that unchanged parts are not re-checked.
+"""
+
+import contextlib
+import hashlib
+import io
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+
+def hash_content(content):
+    """Return the content hash used to detect changed parts."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class BaselineHashes(Mapping):
+    """Content hashes of the baseline parts, computed on first lookup.
+
+    Used as ValidationState.baseline_hashes when the baseline is a directory
+    (or several, searched in order) rather than an archive: nothing is read up
+    front, and each part is hashed at most once, when a validator first asks
+    for it. Instances are picklable, so they can be handed to worker processes.
+
+    Args:
+        roots: Directories searched in order for each part
+        names: Posix part paths that exist in the baseline; lookups of any
+            other name fail even if a file of that name appears under a root
+    """
+
+    def __init__(self, roots, names):
+        self.roots = [Path(root) for root in roots]
+        self.names = frozenset(names)
+        self._hashes = {}
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(name)
+        if name not in self._hashes:
+            for root in self.roots:
+                path = root / name
+                if path.is_file():
+                    self._hashes[name] = hash_content(path.read_bytes())
+                    break
+            else:
+                raise KeyError(name)
+        return self._hashes[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+class ValidationState:
+    """Results of previous validation runs over the same document package.
+
+    Validators given a state record every per-part result under the content
+    hashes of the files it was computed from (the part itself, plus e.g. its
+    .rels file). On the next run, parts whose hashes still match reuse the
+    recorded result and only dirty parts are re-checked.
+
+    Whole-package passes (relationship targets, content types) are recorded
+    together with their printed output and a key describing everything they
+    depend on; they are only re-run when that key changes, otherwise their
+    output is replayed.
+
+    Attributes:
+        baseline_hashes: Mapping of part path (posix, relative to the package
+            root) to the content hash of the part in the baseline. Parts that
+            still match the baseline inherit its XSD verdict: they cannot
+            introduce new schema errors.
+    """
+
+    def __init__(self, baseline_hashes=None):
+        self.baseline_hashes = baseline_hashes if baseline_hashes is not None else {}
+        self._results = {}
+
+    def lookup(self, check, part, key):
+        """Look up a recorded result.
+
+        Args:
+            check: Name of the check
+            part: Part path the result belongs to (None for whole-package passes)
+            key: Hashes of everything the result was computed from
+
+        Returns:
+            tuple: (found, value)
+        """
+        entry = self._results.get((check, part))
+        if entry is not None and entry[0] == key:
+            return True, entry[1]
+        return False, None
+
+    def store(self, check, part, key, value):
+        """Record a result computed from inputs identified by key."""
+        self._results[(check, part)] = (key, value)
+
+    def run_pass(self, check, key, method):
+        """Run a whole-package pass, or replay it if its inputs are unchanged.
+
+        Args:
+            check: Name of the pass
+            key: Hashable description of everything the pass depends on
+            method: Callable running the pass; prints its report and returns bool
+
+        Returns:
+            bool: The result of the pass
+        """
+        found, value = self.lookup(check, None, key)
+        if found:
+            result, output = value
+            sys.stdout.write(output)
+            return result
+
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            result = method()
+        output = buffer.getvalue()
+        sys.stdout.write(output)
+
+        self.store(check, None, key, (result, output))
+        return result
+
+    def clear(self):
+        """Forget all recorded results (the baseline hashes are kept)."""
+        self._results.clear()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -2,117 +2,251 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import bisect
+import difflib
+import xml.etree.ElementTree as ET
+from itertools import zip_longest
 from pathlib import Path
 
+from .baseline import OriginalBaseline
+from .incremental import hash_content
+
+# Unmatched paragraphs held back while looking for the point where the two
+# documents realign, when the comparison is bounded by max_differences
+RESYNC_WINDOW = 100
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_docx,
+        verbose=False,
+        state=None,
+        max_differences=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+        # Stop comparing after this many differing paragraphs (None = report all)
+        self.max_differences = max_differences
+        # Results of earlier runs; validation is skipped if document.xml is unchanged
+        self.state = state
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
+        if self.state is None:
+            return self._validate()
+        return self.state.run_pass("redlining", self._get_state_key(), self._validate)
+
+    def _get_state_key(self):
+        """Return everything the redlining check depends on."""
+        modified_file = self.unpacked_dir / "word" / "document.xml"
+        modified_hash = (
+            hash_content(modified_file.read_bytes()) if modified_file.exists() else None
+        )
+        return (
+            str(self.original_docx.resolve()),
+            self.original_docx.stat().st_mtime_ns,
+            modified_hash,
+        )
+
+    def _validate(self):
+        """Run the redlining check (uncached)."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
         if not modified_file.exists():
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        # Redlining validation is only needed if tracked changes by Claude have been used.
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
+            if not self._has_claude_changes(modified_file):
                 if self.verbose:
                     print("PASSED - No tracked changes by Claude found.")
                 return True
-
         except Exception:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
-
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
-
-    def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        # Stream only document.xml from the original (archive or baseline directory)
+        baseline = OriginalBaseline(self.original_docx)
+        try:
+            original_stream = baseline.open("word/document.xml")
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        if original_stream is None:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+
+        # Compare the text of both documents with Claude's tracked changes
+        # removed, paragraph by paragraph as they are parsed
+        try:
+            with original_stream, open(modified_file, "rb") as modified_stream:
+                difference = self._compare_paragraphs(original_stream, modified_stream)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        finally:
+            baseline.close()
+
+        if difference is not None:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(*difference)
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _has_claude_changes(self, xml_file):
+        """Check for w:ins or w:del authored by Claude, stopping at the first one."""
+        ins_tag = f"{{{self.namespaces['w']}}}ins"
+        del_tag = f"{{{self.namespaces['w']}}}del"
+        author_attr = f"{{{self.namespaces['w']}}}author"
+
+        stack = []
+        for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+            if event == "start":
+                if elem.tag in (ins_tag, del_tag) and elem.get(author_attr) == "Claude":
+                    return True
+                stack.append(elem)
+            else:
+                stack.pop()
+                if stack:
+                    # Children are never looked at again once parsed
+                    stack[-1].clear()
+        return False
+
+    def _compare_paragraphs(self, original_source, modified_source):
+        """Compare the paragraphs of two document.xml streams.
+
+        Paragraphs are read from both streams in step. After a difference,
+        unmatched paragraphs are held back until a paragraph present on both
+        sides realigns the documents (see _take_aligned_blocks), so an
+        inserted or deleted paragraph counts as one difference instead of
+        shifting every paragraph after it. Matching paragraphs are dropped, so
+        only the differences are kept in memory.
+
+        Returns:
+            None if the texts match, otherwise a tuple (blocks, truncated).
+            blocks is a list of (original paragraphs, modified paragraphs)
+            pairs, one per changed region. With max_differences set, reading
+            stops once that many paragraphs differ, truncated is True, and
+            only the regions aligned before that point are reported.
+        """
+        original = self._iter_paragraphs(original_source)
+        modified = self._iter_paragraphs(modified_source)
+
+        # Without a bound, never give up looking for the point of realignment
+        window = RESYNC_WINDOW if self.max_differences else None
+        blocks = []
+        old_pending, new_pending = [], []
+        differences = 0
+        truncated = False
+        for old, new in zip_longest(original, modified):
+            if old == new and not old_pending and not new_pending:
+                continue
+            if old is not None:
+                old_pending.append(old)
+            if new is not None:
+                new_pending.append(new)
+
+            aligned = _take_aligned_blocks(old_pending, new_pending)
+            if window and len(old_pending) + len(new_pending) > window:
+                # No realignment in sight: report the first paragraphs as changed
+                aligned.append((old_pending[:1], new_pending[:1]))
+                del old_pending[:1], new_pending[:1]
+                aligned.extend(_take_aligned_blocks(old_pending, new_pending))
+
+            for block in aligned:
+                blocks.append(block)
+                differences += max(len(block[0]), len(block[1]))
+            if self.max_differences and differences >= self.max_differences:
+                truncated = True
+                break
+
+        if not truncated and (old_pending or new_pending):
+            blocks.append((old_pending, new_pending))
+        if not blocks:
+            return None
+        return blocks, truncated
+
+    def _iter_paragraphs(self, source):
+        """Yield the text of each paragraph with Claude's tracked changes removed.
+
+        Streams the XML with iterparse: w:ins by Claude are skipped and w:del by
+        Claude are unwrapped (their w:delText counts as text). Elements are
+        cleared as soon as they are parsed, so memory use does not grow with
+        the document.
+
+        Empty paragraphs are skipped to avoid false positives when tracked
+        insertions add only structural elements without text content.
+        """
+        p_tag = f"{{{self.namespaces['w']}}}p"
+        t_tag = f"{{{self.namespaces['w']}}}t"
+        deltext_tag = f"{{{self.namespaces['w']}}}delText"
+        ins_tag = f"{{{self.namespaces['w']}}}ins"
+        del_tag = f"{{{self.namespaces['w']}}}del"
+        author_attr = f"{{{self.namespaces['w']}}}author"
+
+        stack = []  # (element, kind) of the open elements
+        removed = 0  # Depth of Claude's w:ins around the current element
+        unwrapped = 0  # Depth of Claude's w:del around the current element
+        paragraphs = []  # [text_parts, closed] per paragraph, in document order
+        open_paragraphs = []  # Text parts of the paragraphs being parsed
+
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                kind = None
+                if tag == ins_tag and elem.get(author_attr) == "Claude":
+                    kind = "ins"
+                    removed += 1
+                elif tag == del_tag and elem.get(author_attr) == "Claude":
+                    kind = "del"
+                    unwrapped += 1
+                elif tag == p_tag and not removed:
+                    kind = "p"
+                    entry = [[], False]
+                    paragraphs.append(entry)
+                    open_paragraphs.append(entry)
+                stack.append((elem, kind))
+                continue
+
+            _, kind = stack.pop()
+            if kind == "ins":
+                removed -= 1
+            elif kind == "del":
+                unwrapped -= 1
+            elif kind == "p":
+                open_paragraphs.pop()[1] = True
+            elif not removed and elem.text:
+                if tag == t_tag or (tag == deltext_tag and unwrapped):
+                    # Nested paragraphs contain the text of their inner paragraphs
+                    for parts, _ in open_paragraphs:
+                        parts.append(elem.text)
+
+            # Children are never looked at again once parsed
+            if stack:
+                stack[-1][0].clear()
+
+            # Paragraphs are yielded in the order they start
+            while paragraphs and paragraphs[0][1]:
+                text = "".join(paragraphs.pop(0)[0])
+                if text:
+                    yield text
+
+    def _generate_detailed_diff(self, blocks, truncated=False):
+        """Generate detailed character-level differences (see _get_word_diff)."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +261,202 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+        error_parts.extend(
+            [
+                "Differences:",
+                "============",
+                "\n".join(
+                    self._get_word_diff(original, modified)
+                    for original, modified in blocks
+                ),
+            ]
+        )
+        if truncated:
+            error_parts.append(
+                f"(Comparison stopped after {self.max_differences} differing paragraphs)"
+            )
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
+    def _get_word_diff(self, original, modified):
+        """Generate a character-level word diff of the changed paragraphs.
 
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
+        Paragraphs are aligned first (see _match_paragraphs), then each changed
+        paragraph is diffed character by character. Like
+        `git diff --word-diff=plain --word-diff-regex=. -U0`, only changed
+        paragraphs are shown, one per line, with removed text in [-...-] and
+        added text in {+...+}.
 
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        Args:
+            original: Paragraphs of the original document
+            modified: Paragraphs of the modified document
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        lines = []
+        for tag, i1, i2, j1, j2 in _match_paragraphs(original, modified):
+            if tag == "equal":
+                continue
+            old, new = original[i1:i2], modified[j1:j2]
+            # Pair the changed paragraphs in order; the rest were removed or added
+            for k in range(max(len(old), len(new))):
+                if k < len(old) and k < len(new):
+                    lines.append(_mark_changes(old[k], new[k]))
+                elif k < len(old):
+                    lines.append(f"[-{old[k]}-]")
+                else:
+                    lines.append(f"{{+{new[k]}+}}")
+        return "\n".join(lines)
+
+
+def _take_aligned_blocks(old_pending, new_pending):
+    """Remove the changed regions that can be aligned from two paragraph lists.
+
+    The lists hold paragraphs read after a difference. Wherever a paragraph
+    occurs on both sides (the pair closest to the start is taken), the
+    paragraphs before it form a changed region, and it and any paragraphs
+    matching after it are dropped. What is left cannot be aligned yet.
+
+    Returns:
+        list: (original paragraphs, modified paragraphs) per changed region
+    """
+    blocks = []
+    while True:
+        while old_pending and new_pending and old_pending[0] == new_pending[0]:
+            del old_pending[0], new_pending[0]
+        first_new = {}
+        for j, text in enumerate(new_pending):
+            first_new.setdefault(text, j)
+        sync = None
+        for i, text in enumerate(old_pending):
+            j = first_new.get(text)
+            if j is not None and (sync is None or i + j < sum(sync)):
+                sync = (i, j)
+        if sync is None:
+            return blocks
+        i, j = sync
+        blocks.append((old_pending[:i], new_pending[:j]))
+        del old_pending[: i + 1], new_pending[: j + 1]
+
+
+def _match_paragraphs(a, b):
+    """Align two lists of paragraphs, in roughly linear time.
+
+    Common leading and trailing paragraphs are matched first. In between,
+    paragraphs occurring exactly once on both sides serve as anchors (looked up
+    by hash); the longest run of anchors in the same order on both sides is
+    kept, and the gaps between anchors are aligned the same way. Gaps without
+    anchors are reported as a single changed block.
+
+    Returns:
+        list: (tag, i1, i2, j1, j2) tuples as in difflib.SequenceMatcher.get_opcodes,
+            with tag "equal", "replace", "delete" or "insert"
+    """
+    matches = []  # (i, j) pairs of matched paragraphs, in order
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        a_lo, a_hi, b_lo, b_hi = stack.pop()
+
+        # Common prefix and suffix
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            matches.append((a_lo, b_lo))
+            a_lo, b_lo = a_lo + 1, b_lo + 1
+        suffix = []
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi, b_hi = a_hi - 1, b_hi - 1
+            suffix.append((a_hi, b_hi))
+        matches.extend(reversed(suffix))
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        anchors = _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi)
+        if not anchors:
+            continue
+
+        # Recurse into the gaps between anchors (last gap first on the stack,
+        # so gaps are processed front to back)
+        bounds = [(a_lo - 1, b_lo - 1), *anchors, (a_hi, b_hi)]
+        gaps = []
+        for (i, j), (next_i, next_j) in zip(bounds, bounds[1:]):
+            gaps.append((i + 1, next_i, j + 1, next_j))
+        matches.extend(anchors)
+        stack.extend(reversed(gaps))
+
+    matches.sort()
+    opcodes = []
+    i = j = 0
+    for match_i, match_j in [*matches, (len(a), len(b))]:
+        if i < match_i or j < match_j:
+            if i < match_i and j < match_j:
+                tag = "replace"
+            elif i < match_i:
+                tag = "delete"
+            else:
+                tag = "insert"
+            opcodes.append((tag, i, match_i, j, match_j))
+        if match_i < len(a):
+            if opcodes and opcodes[-1][0] == "equal":
+                _, start_i, _, start_j, _ = opcodes.pop()
+            else:
+                start_i, start_j = match_i, match_j
+            opcodes.append(("equal", start_i, match_i + 1, start_j, match_j + 1))
+        i, j = match_i + 1, match_j + 1
+    return opcodes
+
+
+def _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi):
+    """Return the longest in-order run of paragraphs unique to both ranges.
+
+    Returns:
+        list: (i, j) index pairs, increasing in both i and j
+    """
+    counts = {}
+    for i in range(a_lo, a_hi):
+        entry = counts.setdefault(a[i], [0, i, 0, None])
+        entry[0] += 1
+    for j in range(b_lo, b_hi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[2] += 1
+            entry[3] = j
+    candidates = sorted(
+        (i, j) for count_a, i, count_b, j in counts.values() if count_a == count_b == 1
+    )
+
+    # Longest increasing subsequence of j (patience sorting)
+    tails = []  # Smallest j ending an increasing run of each length
+    tail_index = []  # Candidate index of each tail
+    previous = [None] * len(candidates)
+    for index, (_, j) in enumerate(candidates):
+        length = bisect.bisect_left(tails, j)
+        if length == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[length] = j
+            tail_index[length] = index
+        previous[index] = tail_index[length - 1] if length else None
+
+    anchors = []
+    index = tail_index[-1] if tail_index else None
+    while index is not None:
+        anchors.append(candidates[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _mark_changes(old, new):
+    """Mark the character-level changes between two paragraphs."""
+    parts = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            parts.append(old[i1:i2])
+            continue
+        if i1 < i2:
+            parts.append(f"[-{old[i1:i2]}-]")
+        if j1 < j2:
+            parts.append(f"{{+{new[j1:j2]}+}}")
+    return "".join(parts)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+"""
+Pool of parsed XML trees shared by all passes of a validator.
+"""
+
+import copy
+from pathlib import Path
+
+import lxml.etree
+
+
+class TreePool:
+    """Parse-once cache of the XML parts of an unpacked document.
+
+    Every validation pass borrows trees from the pool instead of calling
+    lxml.etree.parse itself, so each part is parsed once per validation run
+    no matter how many passes inspect it.
+
+    Trees returned by parse() and getroot() are shared and must be treated as
+    read-only. Passes that need to modify a tree (e.g. stripping
+    mc:AlternateContent) must use clone(), which returns a private deep copy.
+    Parse failures are cached as well and re-raised on every borrow, so each
+    pass still sees the same exception it would have seen parsing the file.
+    """
+
+    def __init__(self):
+        self._trees = {}
+        self._contents = {}
+
+    def parse(self, xml_file):
+        """Return the shared parsed tree for xml_file.
+
+        Args:
+            xml_file: Path to the XML file
+
+        Returns:
+            lxml.etree._ElementTree: The shared (read-only) tree
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+            OSError: If the file cannot be read
+        """
+        key = Path(xml_file)
+        if key not in self._trees:
+            try:
+                self._trees[key] = lxml.etree.parse(str(key))
+            except Exception as e:
+                self._trees[key] = e
+
+        tree = self._trees[key]
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    def getroot(self, xml_file):
+        """Return the root element of the shared tree for xml_file."""
+        return self.parse(xml_file).getroot()
+
+    def clone(self, xml_file):
+        """Return a private copy of the tree that the caller may modify."""
+        return copy.deepcopy(self.parse(xml_file))
+
+    def read_bytes(self, xml_file):
+        """Return the raw bytes of xml_file, read once."""
+        key = Path(xml_file)
+        if key not in self._contents:
+            self._contents[key] = key.read_bytes()
+        return self._contents[key]
+
+    def invalidate(self, xml_file=None):
+        """Forget cached trees for xml_file, or for every file if None."""
+        if xml_file is None:
+            self._trees.clear()
+            self._contents.clear()
+        else:
+            self._trees.pop(Path(xml_file), None)
+            self._contents.pop(Path(xml_file), None)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', backend="lxml")  # Faster on large documents
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -26,23 +27,130 @@ Usage:
     doc.save()
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+import lxml.etree
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.incremental import BaselineHashes, ValidationState
+from ooxml.scripts.unpack import LAZY_MANIFEST, format_part
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor, _qualified_to_clark
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Differing paragraphs the redlining check reports before it stops reading
+REDLINING_MAX_DIFFERENCES = 20
+
+# Parts edited by Document itself, checked out into the session when it opens
+SESSION_PARTS = (
+    "[Content_Types].xml",
+    "word/_rels/document.xml.rels",
+    "word/document.xml",
+    "word/settings.xml",
+    "word/people.xml",
+    "word/comments.xml",
+    "word/commentsExtended.xml",
+    "word/commentsIds.xml",
+    "word/commentsExtensible.xml",
+)
+
+
+class IdAllocator:
+    """Hands out the ids of one editing session without rescanning parts.
+
+    Each id space is filled once from the parts that use it (see
+    DocxXMLEditor._reserve_ids) and then served in O(1):
+    - "change": w:id of w:ins/w:del, one counter across all parts
+    - "comment": w:id of w:comment
+    - "para": w14:paraId, random hex ids not used anywhere yet
+    - "durable": w16cid:durableId, random hex ids not used anywhere yet
+
+    Ids handed out are remembered, so check() can find those that were
+    duplicated by edits made without the allocator (e.g. direct DOM changes).
+    """
+
+    def __init__(self):
+        self._next = {}  # Next free id of each integer space
+        self._used = {}  # Ids known in each hex space
+        self._issued = {}  # Ids handed out in each space
+
+    def reserve(self, space, ids):
+        """Mark existing integer ids (ints or numeric strings) as taken."""
+        highest = self._next.get(space, 0) - 1
+        for value in ids:
+            try:
+                highest = max(highest, int(value))
+            except (TypeError, ValueError):
+                pass
+        self._next[space] = highest + 1
+
+    def reserve_hex(self, space, ids):
+        """Mark existing hex ids as taken."""
+        self._used.setdefault(space, set()).update(
+            value.upper() for value in ids if value
+        )
+
+    def peek(self, space):
+        """Return the id next_id() hands out next, without taking it."""
+        return self._next.get(space, 0)
+
+    def next_id(self, space):
+        """Take the next free integer id."""
+        value = self._next.get(space, 0)
+        self._next[space] = value + 1
+        self._issued.setdefault(space, set()).add(str(value))
+        return value
+
+    def hex_id(self, space):
+        """Take a random hex id not used in the space (see _generate_hex_id)."""
+        used = self._used.setdefault(space, set())
+        value = _generate_hex_id()
+        while value in used:
+            value = _generate_hex_id()
+        used.add(value)
+        self._issued.setdefault(space, set()).add(value)
+        return value
+
+    def check(self, ids):
+        """Find handed-out ids that now occur more than once.
+
+        Args:
+            ids: Mapping of space to every id value currently in the parts
+
+        Returns:
+            dict: Space to sorted list of duplicated ids (empty if none)
+        """
+        collisions = {}
+        for space, values in ids.items():
+            issued = self._issued.get(space)
+            if not issued:
+                continue
+            seen = set()
+            duplicated = set()
+            for value in values:
+                value = value.upper() if space in ("para", "durable") else value
+                if value in issued:
+                    if value in seen:
+                        duplicated.add(value)
+                    seen.add(value)
+            if duplicated:
+                collisions[space] = sorted(duplicated)
+        return collisions
+
+    def has_issued(self):
+        """Check whether any id has been handed out."""
+        return any(self._issued.values())
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -57,7 +165,12 @@ class DocxXMLEditor(XMLEditor):
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        ids: IdAllocator = None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,52 +179,79 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            ids: IdAllocator shared with other parts (default: one for this part)
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self.ids = ids if ids is not None else IdAllocator()
+        self._ids_reserved = False
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Get the next available change ID (the part is scanned only once)."""
+        self._reserve_ids()
+        return self.ids.next_id("change")
+
+    def _reserve_ids(self):
+        """Reserve the ids used in this part with the allocator, once."""
+        if self._ids_reserved:
+            return
+        self._ids_reserved = True
+        self._reserve_ids_of(self.dom.getElementsByTagName("*"))
+
+    def _reserve_ids_of(self, elements):
+        """Reserve the ids used by the given elements."""
+        ids = self._collect_ids(elements)
+        self.ids.reserve("change", ids["change"])
+        self.ids.reserve("comment", ids["comment"])
+        self.ids.reserve_hex("para", ids["para"])
+        self.ids.reserve_hex("durable", ids["durable"])
+
+    def _collect_ids(self, elements):
+        """Return the ids of each IdAllocator space used by the elements."""
+        ids = {"change": [], "comment": [], "para": [], "durable": []}
+        for elem in elements:
+            tag = elem.tagName
+            if tag in ("w:ins", "w:del"):
+                ids["change"].append(elem.getAttribute("w:id"))
+            elif tag == "w:comment":
+                ids["comment"].append(elem.getAttribute("w:id"))
+            elif tag == "w:p":
+                ids["para"].append(elem.getAttribute("w14:paraId"))
+            elif tag == "w16cid:commentId":
+                ids["durable"].append(elem.getAttribute("w16cid:durableId"))
+        return ids
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._ensure_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._ensure_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
+        self._ensure_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
         root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+
+    def _first_text(self, elem):
+        """Return the text at the start of an element, or None."""
+        if elem.firstChild and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE:
+            return elem.firstChild.data
+        return None
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -127,19 +267,38 @@ class DocxXMLEditor(XMLEditor):
         Args:
             nodes: List of DOM nodes to process
         """
-        from datetime import datetime, timezone
-
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
             parent = elem.parentNode
-            while parent:
+            while parent is not None:
                 if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
                     return True
                 parent = parent.parentNode
             return False
 
+        # Every new element, visited once
+        elements = []
+        for node in nodes:
+            if node.nodeType == node.ELEMENT_NODE:
+                elements.append(node)
+                elements.extend(node.getElementsByTagName("*"))
+
+        # Ids given in the new content are taken before new ones are handed out
+        self._reserve_ids()
+        self._reserve_ids_of(elements)
+
+        # Runs inside a w:del, either a new one or one the content was put in
+        deleted_runs = set()
+        for elem in elements:
+            if elem.tagName == "w:del":
+                deleted_runs.update(elem.getElementsByTagName("w:r"))
+        for node in nodes:
+            if node.nodeType == node.ELEMENT_NODE and is_inside_deletion(node):
+                deleted_runs.add(node)
+                deleted_runs.update(node.getElementsByTagName("w:r"))
+
         def add_rsid_to_p(elem):
             if not elem.hasAttribute("w:rsidR"):
                 elem.setAttribute("w:rsidR", self.rsid)
@@ -150,14 +309,14 @@ class DocxXMLEditor(XMLEditor):
             # Add w14:paraId and w14:textId if not present
             if not elem.hasAttribute("w14:paraId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
+                elem.setAttribute("w14:paraId", self.ids.hex_id("para"))
             if not elem.hasAttribute("w14:textId"):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
         def add_rsid_to_r(elem):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if elem in deleted_runs:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -195,47 +354,27 @@ class DocxXMLEditor(XMLEditor):
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
-
-        for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
-                continue
-
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            text = self._first_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not elem.hasAttribute("xml:space"):
+                    elem.setAttribute("xml:space", "preserve")
+
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+        for elem in elements:
+            handler = handlers.get(elem.tagName)
+            if handler:
+                handler(elem)
+
+        # Index the new attribute values (e.g. w:id) for get_node lookups
+        self._update_index(nodes)
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -556,6 +695,7 @@ class DocxXMLEditor(XMLEditor):
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
+                self._update_index([rPr])
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
@@ -593,6 +733,229 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor backed by lxml (see LxmlXMLEditor).
+
+    Offers the same API as DocxXMLEditor. The tracked change helpers are
+    implemented on lxml elements, where text lives in element.text and
+    element.tail instead of separate text nodes.
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed tree for direct manipulation
+        dom: Minimal document wrapper around tree
+    """
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
+        root = self.tree.getroot()
+        if prefix in root.nsmap:
+            return
+        # lxml cannot add a declaration directly; keep every existing prefix,
+        # including ones only referenced from mc:Ignorable
+        prefixes = {p for elem in root.iter(lxml.etree.Element) for p in elem.nsmap}
+        prefixes.discard(None)
+        lxml.etree.cleanup_namespaces(
+            root, top_nsmap={prefix: uri}, keep_ns_prefixes=[*prefixes, prefix]
+        )
+
+    def _first_text(self, elem):
+        """Return the text at the start of an element, or None."""
+        return elem.text
+
+    def _create_element(self, name):
+        """Create a detached element from a qualified name ("w:del")."""
+        root = self.tree.getroot()
+        return root.makeelement(_qualified_to_clark(root, name))
+
+    def _rename_element(self, elem, name):
+        """Replace elem by an element named name with its attributes and content."""
+        renamed = self._create_element(name)
+        renamed.attrib.update(elem.attrib)
+        renamed.text = elem.text
+        renamed.extend(list(elem))
+        renamed.tail = elem.tail
+        elem.getparent().replace(elem, renamed)
+        return renamed
+
+    def _mark_run_deleted(self, run):
+        """Convert w:t to w:delText and w:rsidR to w:rsidDel in a run."""
+        for t_elem in run.getElementsByTagName("w:t"):
+            self._rename_element(t_elem, "w:delText")
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+        """
+        if elem.tagName == "w:ins":
+            ins_elements = [elem]
+        else:
+            ins_elements = elem.getElementsByTagName("w:ins")
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{elem.tagName}> contains no insertions. "
+            )
+
+        for ins_elem in ins_elements:
+            runs = ins_elem.getElementsByTagName("w:r")
+            if not runs:
+                continue
+
+            for run in runs:
+                self._mark_run_deleted(run)
+
+            # Move all content of the insertion into a deletion wrapper
+            del_wrapper = self._create_element("w:del")
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(list(ins_elem))
+            ins_elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+        """
+        is_single_del = elem.tagName == "w:del"
+        if is_single_del:
+            del_elements = [elem]
+        else:
+            del_elements = elem.getElementsByTagName("w:del")
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{elem.tagName}> contains no deletions. "
+            )
+
+        created_insertion = None
+        for del_elem in del_elements:
+            runs = del_elem.getElementsByTagName("w:r")
+            if not runs:
+                continue
+
+            ins_elem = self._create_element("w:ins")
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                for node in new_run.iter():
+                    node.sourceline = 0  # Not part of the original file
+                for del_text in new_run.getElementsByTagName("w:delText"):
+                    self._rename_element(del_text, "w:t")
+                if new_run.hasAttribute("w:rsidDel"):
+                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
+                    new_run.removeAttribute("w:rsidDel")
+                elif not new_run.hasAttribute("w:rsidR"):
+                    new_run.setAttribute("w:rsidR", self.rsid)
+                ins_elem.append(new_run)
+
+            del_elem.addnext(ins_elem)
+            self._inject_attributes_to_nodes([ins_elem])
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion.
+        """
+        if elem.nodeName == "w:r":
+            if elem.getElementsByTagName("w:delText"):
+                raise ValueError("w:r element already contains w:delText")
+
+            self._mark_run_deleted(elem)
+
+            # Wrap in w:del, keeping the formatting whitespace outside of it
+            del_wrapper = self._create_element("w:del")
+            del_wrapper.tail, elem.tail = elem.tail, None
+            elem.getparent().replace(elem, del_wrapper)
+            del_wrapper.append(elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return del_wrapper
+
+        elif elem.nodeName == "w:p":
+            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+                raise ValueError("w:p element already contains tracked changes")
+
+            pPr_list = elem.getElementsByTagName("w:pPr")
+            is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
+
+            if is_numbered:
+                # Add <w:del/> to w:rPr in w:pPr
+                pPr = pPr_list[0]
+                rPr_list = pPr.getElementsByTagName("w:rPr")
+                if not rPr_list:
+                    rPr = self._create_element("w:rPr")
+                    pPr.append(rPr)
+                else:
+                    rPr = rPr_list[0]
+
+                del_marker = self._create_element("w:del")
+                del_marker.tail, rPr.text = rPr.text, None
+                rPr.insert(0, del_marker)
+                self._update_index([rPr])
+
+            for run in elem.getElementsByTagName("w:r"):
+                self._mark_run_deleted(run)
+
+            # Wrap all non-pPr content (including text) in <w:del>
+            pPr_tag = _qualified_to_clark(elem, "w:pPr")
+            del_wrapper = self._create_element("w:del")
+            del_wrapper.text, elem.text = elem.text, None
+            for child in list(elem):
+                if child.tag == pPr_tag:
+                    text, child.tail = child.tail, None
+                    if text and len(del_wrapper):
+                        del_wrapper[-1].tail = (del_wrapper[-1].tail or "") + text
+                    elif text:
+                        del_wrapper.text = (del_wrapper.text or "") + text
+                else:
+                    del_wrapper.append(child)
+            elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+
+
+# Parts holding comments and the root element new comments are appended to
+COMMENT_PARTS = {
+    "word/comments.xml": "w:comments",
+    "word/commentsExtended.xml": "w15:commentsEx",
+    "word/commentsIds.xml": "w16cid:commentsIds",
+    "word/commentsExtensible.xml": "w16cex:commentsExtensible",
+}
+
+# Tracked-change operations accepted by Document.apply_changes
+CHANGE_OPERATIONS = (
+    "delete",
+    "revert_insertion",
+    "revert_deletion",
+    "insert_before",
+    "insert_after",
+)
+
+# Editor classes selectable with Document(backend=...)
+EDITOR_BACKENDS = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -604,13 +967,44 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _initials(author: str) -> str:
+    """Derive initials from an author name ("Review Bot" -> "RB")."""
+    return "".join(word[0] for word in author.split()).upper() or "C"
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _list_parts(root) -> set:
+    """Return the posix paths (relative to root) of all files below root."""
+    parts = set()
+    for dirpath, _, filenames in os.walk(root):
+        relative_dir = Path(dirpath).relative_to(root)
+        parts.update((relative_dir / name).as_posix() for name in filenames)
+    return parts
+
+
+def _link_or_copy(source, destination):
+    """Hard-link source to destination, copying it if linking is not possible."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        # Different file systems, or links not supported
+        shutil.copy2(source, destination)
+
+
 class Document:
-    """Manages comments in unpacked Word documents."""
+    """Manages comments in unpacked Word documents.
+
+    Edits are made copy-on-write: the unpacked directory is read in place, and
+    only parts that are opened for editing (or added) are copied into the
+    session directory `unpacked_path`. The validation baseline consists of
+    pristine copies of those parts, taken before the original can change, and
+    content hashes of the original parts computed on first use.
+    """
 
     def __init__(
         self,
@@ -619,6 +1013,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,20 +1025,40 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: XML engine used by the editors, "minidom" (default) or "lxml".
+                The lxml backend loads large documents faster and with far less
+                memory; its elements are lxml elements (see LxmlXMLEditor).
         """
+        if backend not in EDITOR_BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend} (expected one of {', '.join(EDITOR_BACKENDS)})"
+            )
+        self.backend = backend
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory with subdirectories for edited parts
+        # (the session overlay), the validation baseline and validation views
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
-
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        self.baseline_path = Path(self.temp_dir) / "baseline"
+        self.unpacked_path.mkdir()
+        self.baseline_path.mkdir()
+
+        # Parts of the original, known by name only until they are needed
+        self._original_parts = _list_parts(self.original_path)
+        for part in SESSION_PARTS:
+            self._checkout(part)
+
+        # Validation results carried across validate() calls; baseline hashes
+        # are computed on first use so only edited parts are ever re-checked
+        self._validation_state = ValidationState(
+            baseline_hashes=BaselineHashes(
+                [self.baseline_path, self.original_path], self._original_parts
+            )
+        )
 
         self.word_path = self.unpacked_path / "word"
 
@@ -658,15 +1073,19 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Ids handed out during the session, shared by all editors
+        self.ids = IdAllocator()
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
+        # Load existing comments and reserve their IDs (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        if self.comments_path.exists():
+            self["word/comments.xml"]._reserve_ids()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -701,15 +1120,24 @@ class Document:
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
         if xml_path not in self._editors:
-            file_path = self.unpacked_path / xml_path
+            file_path = self._checkout(xml_path)
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+            # Use DocxXMLEditor (or its lxml variant) with RSID, author, and initials
+            self._editors[xml_path] = EDITOR_BACKENDS[self.backend](
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                ids=self.ids,
             )
         return self._editors[xml_path]
 
+    @property
+    def next_comment_id(self) -> int:
+        """The ID the next comment will get."""
+        return self.ids.peek("comment")
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -727,9 +1155,9 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        comment_id = self.ids.next_id("comment")
+        para_id = self._new_hex_id("para")
+        durable_id = self._new_hex_id("durable")
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
@@ -759,7 +1187,6 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
     def reply_to_comment(
@@ -784,9 +1211,9 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        comment_id = self.ids.next_id("comment")
+        para_id = self._new_hex_id("para")
+        durable_id = self._new_hex_id("durable")
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
@@ -827,9 +1254,194 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
+    def add_comments(self, comments) -> list:
+        """
+        Add many comments in one pass.
+
+        Same result as calling add_comment() for each entry, but every entry is
+        checked before anything is changed, and each comment part receives all
+        new comments in a single insertion. Comment IDs are handed out from the
+        session's IdAllocator, and parts are only written by save().
+
+        Args:
+            comments: Iterable of (start, end, text) or (start, end, text, author)
+                tuples, or dicts with the keys start, end, text and optionally
+                author and initials
+
+        Returns:
+            list: The comment IDs that were created, in order
+
+        Raises:
+            ValueError: If an entry is malformed or not anchored in
+                word/document.xml (no comment is added in that case)
+
+        Example:
+            doc.add_comments([
+                (node, node, "Check this date"),
+                (start_node, end_node, "Inconsistent term", "Review Bot"),
+            ])
+        """
+        entries = [self._comment_entry(comment) for comment in comments]
+        if not entries:
+            return []
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        fragments = {part: [] for part in COMMENT_PARTS}
+        comment_ids = []
+
+        for entry in entries:
+            comment_id = self.ids.next_id("comment")
+            para_id = self._new_hex_id("para")
+            durable_id = self._new_hex_id("durable")
+
+            # Add comment ranges to document.xml
+            start, end = entry["start"], entry["end"]
+            self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+            if end.tagName == "w:p":
+                self._document.append_to(end, self._comment_range_end_xml(comment_id))
+            else:
+                self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+
+            fragments["word/comments.xml"].append(
+                self._comment_xml(
+                    comment_id,
+                    para_id,
+                    entry["text"],
+                    entry["author"],
+                    entry["initials"],
+                    timestamp,
+                )
+            )
+            fragments["word/commentsExtended.xml"].append(
+                self._comment_extended_xml(para_id, parent_para_id=None)
+            )
+            fragments["word/commentsIds.xml"].append(
+                self._comment_ids_xml(para_id, durable_id)
+            )
+            fragments["word/commentsExtensible.xml"].append(
+                self._comment_extensible_xml(durable_id)
+            )
+
+            self.existing_comments[comment_id] = {"para_id": para_id}
+            comment_ids.append(comment_id)
+
+        # One insertion per comment part
+        for part, xml in fragments.items():
+            self._append_to_comment_part(part, "\n".join(xml))
+
+        for author in dict.fromkeys(entry["author"] for entry in entries):
+            self._add_author_to_people(author)
+
+        return comment_ids
+
+    def apply_changes(self, changes) -> list:
+        """
+        Apply many tracked-change operations to word/document.xml in one pass.
+
+        Every entry is checked before anything is changed, so a malformed batch
+        leaves the document untouched.
+
+        Args:
+            changes: Iterable of (operation, node) or (operation, node, xml)
+                tuples, or dicts with the keys operation, node and optionally
+                xml and author. Operations:
+                - "delete": suggest_deletion(node)
+                - "revert_insertion": revert_insertion(node)
+                - "revert_deletion": revert_deletion(node)
+                - "insert_before" / "insert_after": insert tracked xml (e.g. a
+                  paragraph from suggest_paragraph()) next to node
+
+        Returns:
+            list: The result of each operation, in order
+
+        Raises:
+            ValueError: If an entry is malformed, not in word/document.xml, or
+                cannot be applied to its node (no change is applied in that case)
+
+        Example:
+            doc.apply_changes([
+                ("delete", run_node),
+                ("insert_after", para_node, DocxXMLEditor.suggest_paragraph(new_p)),
+                {"operation": "revert_insertion", "node": ins_node, "author": "Bot"},
+            ])
+        """
+        entries = [self._change_entry(change) for change in changes]
+        editor = self._document
+        default_author = editor.author
+        results = []
+        try:
+            for entry in entries:
+                editor.author = entry["author"]
+                operation, node = entry["operation"], entry["node"]
+                if operation == "delete":
+                    results.append(editor.suggest_deletion(node))
+                elif operation == "revert_insertion":
+                    results.append(editor.revert_insertion(node))
+                elif operation == "revert_deletion":
+                    results.append(editor.revert_deletion(node))
+                elif operation == "insert_before":
+                    results.append(editor.insert_before(node, entry["xml"]))
+                else:
+                    results.append(editor.insert_after(node, entry["xml"]))
+        finally:
+            editor.author = default_author
+
+        for author in dict.fromkeys(entry["author"] for entry in entries):
+            self._add_author_to_people(author)
+
+        return results
+
+    def list_parts(self, prefix="") -> list:
+        """
+        List the parts of the document, including those added in this session.
+
+        Use this instead of listing unpacked_path, which only holds the parts
+        opened or added so far.
+
+        Args:
+            prefix: Only list parts whose name starts with prefix (e.g. "word/media/")
+
+        Returns:
+            list: Sorted posix part names (e.g. "word/media/image1.png")
+        """
+        parts = (self._original_parts | _list_parts(self.unpacked_path)) - {LAZY_MANIFEST}
+        return sorted(part for part in parts if part.startswith(prefix))
+
+    def add_media(self, source_file, name=None) -> str:
+        """
+        Copy a file (image, ...) into word/media without replacing an existing part.
+
+        Args:
+            source_file: Path to the file to add
+            name: File name in word/media (default: the first free "imageN"
+                name with the extension of source_file)
+
+        Returns:
+            str: The new part name (e.g. "word/media/image3.png"); relationship
+                targets in word/document.xml.rels are relative to word/
+                ("media/image3.png")
+
+        Raises:
+            ValueError: If a part with that name already exists
+        """
+        source_file = Path(source_file)
+        existing = set(self.list_parts("word/media/"))
+        if name is None:
+            number = 1
+            while f"word/media/image{number}{source_file.suffix}" in existing:
+                number += 1
+            name = f"image{number}{source_file.suffix}"
+        part = f"word/media/{name}"
+        if part in existing:
+            raise ValueError(f"Part already exists: {part}")
+
+        target_file = self.unpacked_path / part
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_file, target_file)
+        return part
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
@@ -843,11 +1455,19 @@ class Document:
             ValueError: If validation fails.
         """
         # Create validators with current state
+        view_path = self._build_view()
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path,
+            self.baseline_path,
+            verbose=False,
+            state=self._validation_state,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path,
+            self.baseline_path,
+            verbose=False,
+            state=self._validation_state,
+            max_differences=REDLINING_MAX_DIFFERENCES,
         )
 
         # Run validations
@@ -871,6 +1491,8 @@ class Document:
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
+        self._check_id_collisions()
+
         # Save all modified XML files in temp directory
         for editor in self._editors.values():
             editor.save()
@@ -879,27 +1501,180 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy edited parts to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        in_place = target_path.resolve() == self.original_path.resolve()
+        if not in_place:
+            shutil.copytree(self.original_path, target_path, dirs_exist_ok=True)
+        for part in sorted(_list_parts(self.unpacked_path)):
+            if in_place:
+                # Keep the baseline copy before the original part is overwritten
+                self._snapshot(part)
+            target_file = target_path / part
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.unpacked_path / part, target_file)
+
+    # ==================== Private: IDs ====================
+
+    def _new_hex_id(self, space):
+        """Take a hex id not used in any part opened so far."""
+        for editor in list(self._editors.values()):
+            editor._reserve_ids()
+        return self.ids.hex_id(space)
+
+    def _check_id_collisions(self):
+        """Raise ValueError if ids handed out this session were duplicated.
+
+        Ids are only duplicated by edits made around the allocator, such as
+        nodes with explicit ids added directly to the DOM.
+        """
+        if not self.ids.has_issued():
+            return
+        ids = {"change": [], "comment": [], "para": [], "durable": []}
+        for editor in self._editors.values():
+            for space, values in editor._collect_ids(
+                editor.dom.getElementsByTagName("*")
+            ).items():
+                ids[space].extend(values)
+        collisions = self.ids.check(ids)
+        if collisions:
+            details = "; ".join(
+                f"{space}: {', '.join(values)}" for space, values in collisions.items()
+            )
+            raise ValueError(f"Duplicate IDs introduced by external edits ({details})")
 
-    # ==================== Private: Initialization ====================
+    # ==================== Private: Batch Entries ====================
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
+    def _comment_entry(self, comment):
+        """Normalize and check one entry passed to add_comments()."""
+        if isinstance(comment, dict):
+            entry = dict(comment)
+        elif isinstance(comment, (tuple, list)) and len(comment) in (3, 4):
+            entry = dict(zip(("start", "end", "text", "author"), comment))
+        else:
+            raise ValueError(
+                f"Comment must be (start, end, text[, author]) or a dict, got {comment!r}"
+            )
 
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        missing = {"start", "end", "text"} - entry.keys()
+        if missing:
+            raise ValueError(f"Comment is missing {', '.join(sorted(missing))}")
+        if not isinstance(entry["text"], str):
+            raise ValueError(f"Comment text must be a string, got {entry['text']!r}")
+        for key in ("start", "end"):
+            self._check_document_node(entry[key], f"Comment {key}")
+
+        author = entry.get("author") or self.author
+        if author == self.author:
+            initials = entry.get("initials") or self.initials
+        else:
+            initials = entry.get("initials") or _initials(author)
+        entry["author"], entry["initials"] = author, initials
+        return entry
+
+    def _change_entry(self, change):
+        """Normalize and check one entry passed to apply_changes()."""
+        if isinstance(change, dict):
+            entry = dict(change)
+        elif isinstance(change, (tuple, list)) and len(change) in (2, 3):
+            entry = dict(zip(("operation", "node", "xml"), change))
+        else:
+            raise ValueError(
+                f"Change must be (operation, node[, xml]) or a dict, got {change!r}"
+            )
+
+        operation, node = entry.get("operation"), entry.get("node")
+        if operation not in CHANGE_OPERATIONS:
+            raise ValueError(
+                f"Unknown operation: {operation!r} "
+                f"(expected one of {', '.join(CHANGE_OPERATIONS)})"
+            )
+        self._check_document_node(node, f"Node of {operation}")
+
+        # The checks made by the editor methods, so nothing fails halfway
+        if operation == "delete":
+            if node.tagName == "w:r":
+                if node.getElementsByTagName("w:delText"):
+                    raise ValueError("w:r element already contains w:delText")
+            elif node.tagName == "w:p":
+                if node.getElementsByTagName("w:ins") or node.getElementsByTagName(
+                    "w:del"
+                ):
+                    raise ValueError("w:p element already contains tracked changes")
+            else:
+                raise ValueError(f"Element must be w:r or w:p, got {node.tagName}")
+        elif operation in ("revert_insertion", "revert_deletion"):
+            tag = "w:ins" if operation == "revert_insertion" else "w:del"
+            if node.tagName != tag and not node.getElementsByTagName(tag):
+                raise ValueError(
+                    f"{operation} requires {tag} elements. "
+                    f"The provided element <{node.tagName}> contains none."
+                )
+        elif not isinstance(entry.get("xml"), str):
+            raise ValueError(f"{operation} requires xml content")
+
+        entry["author"] = entry.get("author") or self.author
+        return entry
+
+    def _check_document_node(self, node, description):
+        """Raise ValueError unless node is an element of word/document.xml."""
+        if (
+            getattr(node, "nodeType", None) != 1  # ELEMENT_NODE
+            or not self._document._index.is_attached(node)
+        ):
+            raise ValueError(f"{description} is not an element of word/document.xml")
+
+    # ==================== Private: Session ====================
+
+    def _checkout(self, part):
+        """Copy an original part into the session directory before it is edited.
+
+        Args:
+            part: Posix path of the part relative to the package root
+
+        Returns:
+            Path: The part's path in the session directory (which may not
+                exist if the original has no such part)
+        """
+        session_file = self.unpacked_path / part
+        if not session_file.exists() and part in self._original_parts:
+            # A part left unformatted by `unpack.py --lazy` is formatted in the
+            # original first, as the manifest listing it lives there
+            format_part(self.original_path / part)
+            self._snapshot(part)
+            session_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.original_path / part, session_file)
+        return session_file
+
+    def _snapshot(self, part):
+        """Keep a pristine baseline copy of an original part (once)."""
+        baseline_file = self.baseline_path / part
+        if part in self._original_parts and not baseline_file.exists():
+            baseline_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.original_path / part, baseline_file)
+
+    def _build_view(self):
+        """Assemble the current document (session parts over the original).
+
+        Files are hard-linked where possible, so no content is copied. The view
+        is read-only input for the validators and rebuilt on every call.
+
+        Returns:
+            Path: Directory holding the complete unpacked document
+        """
+        view_path = Path(self.temp_dir) / "view"
+        if view_path.exists():
+            shutil.rmtree(view_path)
+        session_parts = _list_parts(self.unpacked_path)
+        for part in session_parts:
+            # Parts added or replaced directly in unpacked_path need a baseline too
+            self._snapshot(part)
+            _link_or_copy(self.unpacked_path / part, view_path / part)
+        for part in self._original_parts - session_parts:
+            _link_or_copy(self.original_path / part, view_path / part)
+        return view_path
+
+    # ==================== Private: Initialization ====================
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
@@ -1069,67 +1844,81 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
-
-        editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
-
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        self._append_to_comment_part(
+            "word/comments.xml", self._comment_xml(comment_id, para_id, text)
         )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
-  <w:p w14:paraId="{para_id}" w14:textId="77777777">
-    <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
-    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
-  </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
-
-        editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
-
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        self._append_to_comment_part(
+            "word/commentsExtended.xml",
+            self._comment_extended_xml(para_id, parent_para_id),
+        )
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
-
-        editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
-
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        self._append_to_comment_part(
+            "word/commentsIds.xml", self._comment_ids_xml(para_id, durable_id)
+        )
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+        self._append_to_comment_part(
+            "word/commentsExtensible.xml", self._comment_extensible_xml(durable_id)
+        )
 
-        editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+    def _append_to_comment_part(self, part, xml):
+        """Append XML to the root of a comment part, creating it from its template."""
+        path = self.unpacked_path / part
+        if not path.exists():
+            shutil.copy(TEMPLATE_DIR / Path(part).name, path)
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        editor = self[part]
+        root = editor.get_node(tag=COMMENT_PARTS[part])
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
 
+    def _comment_xml(
+        self, comment_id, para_id, text, author=None, initials=None, timestamp=None
+    ):
+        """Generate XML for a comment in comments.xml.
+
+        Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r, and any
+        of w:author, w:date, w:initials not given here are automatically added
+        by DocxXMLEditor.
+        """
+        escaped_text = (
+            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        )
+        attributes = f'w:id="{comment_id}"'
+        if author:
+            attributes += f' w:author="{html.escape(author, quote=True)}"'
+        if timestamp:
+            attributes += f' w:date="{timestamp}"'
+        if initials:
+            attributes += f' w:initials="{html.escape(initials, quote=True)}"'
+        return f'''<w:comment {attributes}>
+  <w:p w14:paraId="{para_id}" w14:textId="77777777">
+    <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
+    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
+  </w:p>
+</w:comment>'''
+
+    def _comment_extended_xml(self, para_id, parent_para_id):
+        """Generate XML for a comment in commentsExtended.xml."""
+        if parent_para_id:
+            return f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+        return f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
+
+    def _comment_ids_xml(self, para_id, durable_id):
+        """Generate XML for a comment in commentsIds.xml."""
+        return f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+
+    def _comment_extensible_xml(self, durable_id):
+        """Generate XML for a comment in commentsExtensible.xml."""
+        return f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+
     def _comment_range_start_xml(self, comment_id):
         """Generate XML for comment range start."""
         return f'<w:commentRangeStart w:id="{comment_id}"/>'
@@ -0,0 +1,72 @@
+import io
+import unittest
+
+from ooxml.scripts.validation.redlining import RedliningValidator
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def paragraph(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def document(paragraphs):
+    body = "".join(paragraphs)
+    return io.BytesIO(
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'.encode()
+    )
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestCompareParagraphs(unittest.TestCase):
+
+    def setUp(self):
+        self.original = [paragraph(f"Paragraph number {i} text.") for i in range(1, 61)]
+
+    def compare(self, modified, max_differences):
+        """Return the diff lines reported for original vs modified"""
+        validator = RedliningValidator(".", ".", max_differences=max_differences)
+        result = validator._compare_paragraphs(
+            document(self.original), document(modified)
+        )
+        if result is None:
+            return None
+        report = validator._generate_detailed_diff(*result)
+        return report.split("============\n", 1)[1].splitlines()
+
+    def test_inserted_paragraph_with_cap(self):
+        """An untracked insertion must not shift the paragraphs after it"""
+        modified = list(self.original)
+        modified[4] = (
+            "<w:p><w:r><w:t>Paragraph number 5 text.</w:t></w:r>"
+            '<w:ins w:author="Claude"><w:r><w:t> added</w:t></w:r></w:ins></w:p>'
+        )
+        modified[29] = paragraph("Paragraph number 30 CHANGED.")
+        modified.insert(9, paragraph("UNTRACKED NEW PARA"))
+
+        expected = [
+            "{+UNTRACKED NEW PARA+}",
+            "Paragraph number 30 [-text-]{+CHANGED+}.",
+        ]
+        self.assertEqual(self.compare(modified, max_differences=20), expected)
+        self.assertEqual(self.compare(modified, max_differences=None), expected)
+
+    def test_cap_reports_only_aligned_differences(self):
+        """Paragraphs not yet realigned when the cap is reached are left out"""
+        modified = list(self.original)
+        modified.insert(9, paragraph("UNTRACKED NEW PARA"))
+        modified[39] = paragraph("Paragraph number 39 CHANGED.")
+
+        lines = self.compare(modified, max_differences=1)
+        self.assertEqual(lines[0], "{+UNTRACKED NEW PARA+}")
+        self.assertEqual(
+            lines[1:], ["(Comparison stopped after 1 differing paragraphs)"]
+        )
+
+    def test_identical_documents(self):
+        """Matching documents report no differences"""
+        self.assertIsNone(self.compare(list(self.original), max_differences=20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,29 +1,353 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py <office_file> <output_dir> --jobs 4
+    python unpack.py <office_file> <output_dir> --lazy
+"""
+
+import argparse
+import io
+import os
 import random
-import sys
-import defusedxml.minidom
+import shutil
 import zipfile
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+import defusedxml.minidom
+import lxml.etree
+
+# Parts that are pretty-printed when unpacking
+XML_SUFFIXES = (".xml", ".rels")
+
+# Declaration written in front of every pretty-printed part
+PRETTY_DECLARATION = '<?xml version="1.0" encoding="ascii"?>\n'
+
+# Indentation used for each nesting level
+INDENT = "  "
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# File in the output directory of a lazy unpack listing the parts (relative
+# POSIX paths, one per line) that are still unformatted; pack.py skips it
+LAZY_MANIFEST = ".unformatted-parts"
+
+
+class _UnsupportedMarkup(Exception):
+    """Raised when a part needs the minidom fallback to format identically."""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to format XML parts (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Leave XML parts unformatted; they are pretty-printed when first "
+        "opened with XMLEditor/Document",
+    )
+    args = parser.parse_args()
+
+    unpack_document(args.office_file, args.output_dir, jobs=args.jobs, lazy=args.lazy)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, jobs=1, lazy=False):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Members are read straight from the archive: XML parts are formatted in
+    memory and written once, binary members (media, fonts, ...) are streamed to
+    disk without ever being read into memory or scanned for XML.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to unpack into
+        jobs: Number of worker processes formatting XML parts (0 = one per CPU)
+        lazy: If True, write XML parts unformatted, list them in
+            LAZY_MANIFEST and format them on first open (see format_part)
+
+    Returns:
+        list: Paths of the unpacked XML parts
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    jobs = jobs if jobs else (os.cpu_count() or 1)
+
+    xml_names = []
+    with zipfile.ZipFile(input_file) as zf:
+        for info in zf.infolist():
+            target = _member_path(output_path, info.filename)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if info.filename.endswith(XML_SUFFIXES):
+                xml_names.append(info.filename)
+            else:
+                with zf.open(info) as src, open(target, "wb") as dest:
+                    shutil.copyfileobj(src, dest)
+
+        if lazy or jobs <= 1 or len(xml_names) <= 1:
+            for name in xml_names:
+                _unpack_part(zf, name, output_path, lazy)
+        else:
+            # Largest parts first so one huge part does not finish last
+            sizes = {name: zf.getinfo(name).file_size for name in xml_names}
+            ordered = sorted(xml_names, key=sizes.get, reverse=True)
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(ordered)),
+                initializer=_init_unpack_worker,
+                initargs=(str(input_file), str(output_path)),
+            ) as executor:
+                list(executor.map(_unpack_part_in_worker, ordered, chunksize=4))
+
+    xml_paths = [_member_path(output_path, name) for name in xml_names]
+    if lazy:
+        manifest = output_path / LAZY_MANIFEST
+        manifest.write_text(
+            "".join(
+                f"{path.relative_to(output_path).as_posix()}\n" for path in xml_paths
+            ),
+            encoding="utf-8",
+        )
+    return xml_paths
+
+
+def format_part(xml_file):
+    """Pretty-print a part left unformatted by a lazy unpack.
+
+    Only parts listed in the LAZY_MANIFEST of an enclosing directory are
+    formatted, once, after which they are removed from the manifest. Any
+    other file, whatever its formatting or encoding, is left untouched.
+
+    Args:
+        xml_file: Path to the XML part
+
+    Returns:
+        bool: True if the part was formatted, False if it was not pending
+    """
+    xml_file = Path(xml_file).resolve()
+    for directory in xml_file.parents:
+        manifest = directory / LAZY_MANIFEST
+        if manifest.is_file():
+            break
+    else:
+        return False
+
+    pending = manifest.read_text(encoding="utf-8").splitlines()
+    name = xml_file.relative_to(directory).as_posix()
+    if name not in pending:
+        return False
+
+    xml_file.write_bytes(pretty_print_xml(xml_file.read_bytes()))
+    pending.remove(name)
+    if pending:
+        manifest.write_text("".join(f"{part}\n" for part in pending), encoding="utf-8")
+    else:
+        manifest.unlink()
+    return True
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+def pretty_print_xml(content):
+    """Pretty-print an XML part exactly like minidom's toprettyxml.
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
+    The output is byte-identical to
+    ``minidom.parseString(content).toprettyxml(indent="  ", encoding="ascii")``
+    but the part is parsed by lxml and serialized in a single pass, without
+    building a DOM. Parts using markup the fast path does not model (CDATA
+    sections, DOCTYPEs, ambiguous attribute prefixes) fall back to minidom.
+
+    Args:
+        content: Raw bytes of the XML part
+
+    Returns:
+        bytes: The pretty-printed part
+    """
+    if b"<![CDATA[" in content or b"<!DOCTYPE" in content:
+        return _pretty_print_minidom(content)
+    try:
+        return _pretty_print_lxml(content)
+    except (_UnsupportedMarkup, lxml.etree.XMLSyntaxError):
+        # minidom raises the same errors unpack always reported
+        return _pretty_print_minidom(content)
+
+
+def _pretty_print_minidom(content):
+    """Pretty-print an XML part with minidom (reference implementation)."""
     dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+    return dom.toprettyxml(indent=INDENT, encoding="ascii")
+
+
+def _pretty_print_lxml(content):
+    """Fast path of pretty_print_xml using lxml."""
+    # Namespace declarations per element, in document order and including
+    # redundant redeclarations, which minidom writes back out
+    declarations = {}
+    pending = []
+    context = lxml.etree.iterparse(
+        io.BytesIO(content),
+        events=("start-ns", "start"),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    for event, item in context:
+        if event == "start-ns":
+            pending.append(item)
+        elif pending:
+            declarations[item] = pending
+            pending = []
+    root = context.root
+
+    out = [PRETTY_DECLARATION]
+    write = out.append
+
+    def write_node(node, indent, scope, prefixes):
+        tag = node.tag
+        if tag is lxml.etree.Comment:
+            write(f"{indent}<!--{node.text or ''}-->\n")
+            return
+        if tag is lxml.etree.PI:
+            write(f"{indent}<?{node.target} {node.text or ''}?>\n")
+            return
+        if not isinstance(tag, str):
+            raise _UnsupportedMarkup(tag)
+
+        # Opening tag: namespace declarations first, then attributes
+        qname = tag.rpartition("}")[2]
+        if node.prefix:
+            qname = f"{node.prefix}:{qname}"
+        write(f"{indent}<{qname}")
+        declared = declarations.get(node)
+        if declared:
+            scope = dict(scope)
+            for prefix, uri in declared:
+                scope[prefix or None] = uri
+                name = f"xmlns:{prefix}" if prefix else "xmlns"
+                write(f' {name}="{_escape(uri)}"')
+            prefixes = _attribute_prefixes(scope)
+        for name, value in node.attrib.items():
+            if name[0] == "{":
+                uri, _, local = name[1:].partition("}")
+                prefix = prefixes.get(uri)
+                if prefix is None:
+                    raise _UnsupportedMarkup(name)
+                name = f"{prefix}:{local}"
+            write(f' {name}="{_escape(value)}"')
+
+        children = len(node)
+        text = node.text
+        if not children:
+            if text:
+                write(f">{_escape(text)}</{qname}>\n")
+            else:
+                write("/>\n")
+            return
+
+        # Mixed or element content: every child node on its own line
+        write(">\n")
+        child_indent = indent + INDENT
+        if text:
+            write(_escape(f"{child_indent}{text}\n"))
+        for child in node:
+            write_node(child, child_indent, scope, prefixes)
+            if child.tail:
+                write(_escape(f"{child_indent}{child.tail}\n"))
+        write(f"{indent}</{qname}>\n")
+
+    scope = {"xml": XML_NAMESPACE}
+    prefixes = _attribute_prefixes(scope)
+    for sibling in reversed(list(root.itersiblings(preceding=True))):
+        write_node(sibling, "", scope, prefixes)
+    write_node(root, "", scope, prefixes)
+    for sibling in root.itersiblings():
+        write_node(sibling, "", scope, prefixes)
+
+    return "".join(out).encode("ascii", "xmlcharrefreplace")
+
+
+def _attribute_prefixes(scope):
+    """Map namespace URIs to the prefix attributes in that namespace use.
+
+    URIs bound to several prefixes are left out: the prefix an attribute was
+    written with cannot be recovered, so such parts use the minidom fallback.
+    """
+    prefixes = {}
+    ambiguous = set()
+    for prefix, uri in scope.items():
+        if prefix is None:
+            continue  # Default namespace never applies to attributes
+        if uri in prefixes and prefixes[uri] != prefix:
+            ambiguous.add(uri)
+        prefixes[uri] = prefix
+    for uri in ambiguous:
+        del prefixes[uri]
+    return prefixes
+
+
+def _escape(data):
+    """Escape text and attribute values the way minidom writes them."""
+    if "&" in data:
+        data = data.replace("&", "&amp;")
+    if "<" in data:
+        data = data.replace("<", "&lt;")
+    if '"' in data:
+        data = data.replace('"', "&quot;")
+    if ">" in data:
+        data = data.replace(">", "&gt;")
+    return data
+
+
+def _member_path(output_path, name):
+    """Return where an archive member is written, never outside output_path."""
+    parts = [
+        part
+        for part in PurePosixPath(name.replace("\\", "/")).parts
+        if part not in ("/", "", ".", "..")
+    ]
+    return output_path.joinpath(*parts)
+
+
+def _unpack_part(zf, name, output_path, lazy=False):
+    """Read one XML part from the archive and write it (formatted) to disk."""
+    content = zf.read(name)
+    if not lazy:
+        content = pretty_print_xml(content)
+    _member_path(output_path, name).write_bytes(content)
+
+
+# Archive opened once per worker process
+_worker_zip = None
+_worker_output = None
+
+
+def _init_unpack_worker(input_file, output_dir):
+    """Open the archive in a worker process of the unpack pool."""
+    global _worker_zip, _worker_output
+    _worker_zip = zipfile.ZipFile(input_file)
+    _worker_output = Path(output_dir)
+
+
+def _unpack_part_in_worker(name):
+    """Format one XML part in a worker process of the unpack pool."""
+    _unpack_part(_worker_zip, name, _worker_output)
+
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,22 @@ Command line tool to validate Office document XML files against XSD schemas and
 
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> --schema-cache <cache_dir>
+    python validate.py <dir> --original <original_file> --jobs 8
+    python validate.py <dir> --original <original_file> --max-differences 0
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    schema_registry,
+)
 
 
 def main():
@@ -30,6 +39,27 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate parts in N worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--schema-cache",
+        metavar="DIR",
+        help="Directory for a persistent cache of XSD validation results",
+    )
+    parser.add_argument(
+        "--max-differences",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Stop the tracked changes check after N differing paragraphs "
+        "(0 = report all, default: 20)",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -42,6 +72,9 @@ def main():
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
+    if args.schema_cache:
+        schema_registry.enable_disk_cache(args.schema_cache)
+
     # Run validations
     match file_extension:
         case ".docx":
@@ -55,7 +88,17 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(
+                unpacked_dir, original_file, verbose=args.verbose, jobs=args.jobs
+            )
+        else:
+            validator = V(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                max_differences=args.max_differences,
+            )
         if not validator.validate():
             success = False
 
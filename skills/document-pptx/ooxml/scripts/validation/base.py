@@ -2,11 +2,18 @@
 Base validator with common validation logic for document files.
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .baseline import OriginalBaseline
+from .incremental import ValidationState, hash_content
+from .schema_cache import schema_registry
+from .tree_pool import TreePool
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,11 +110,26 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, jobs=1, state=None
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Results of earlier runs; when set, only changed parts are re-checked
+        self.state = state
+
+        # Number of worker processes for per-part checks (0 = one per CPU)
+        self.jobs = jobs if jobs else (os.cpu_count() or 1)
+        self._part_results = None
+
+        # Parsed trees shared by every validation pass
+        self.trees = TreePool()
+
+        # Original archive, read member-by-member for baseline comparisons
+        self.baseline = OriginalBaseline(self.original_file)
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -124,24 +146,170 @@ class BaseSchemaValidator:
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _get_part_results(self):
+        """Get per-part check results, computed by a process pool when jobs > 1.
+
+        XSD validation, file-scoped ID checks and r:id checks only look at one
+        part (plus its .rels file), so they are fanned out to worker processes
+        in a single pass. Each worker builds its own validator and therefore
+        holds its own compiled schemas. Results are keyed by file and consumed
+        in self.xml_files order, so output is identical to a serial run.
+
+        With a validation state, parts whose content and .rels file are
+        unchanged since the last run reuse their recorded results and only
+        dirty parts are checked.
+
+        Returns:
+            dict: xml_file -> result dict from _check_part, or None when
+                running serially (passes then check each part inline)
+        """
+        if self._part_results is not None:
+            return self._part_results
+        if self.state is None and (self.jobs <= 1 or len(self.xml_files) < 2):
+            return None
+
+        results = {}
+        dirty = []
+        keys = {}
+        for xml_file in self.xml_files:
+            if self.state is None:
+                dirty.append(xml_file)
+                continue
+            keys[xml_file] = self._content_key(
+                xml_file, self._get_rels_file(xml_file)
+            )
+            found, value = self.state.lookup(
+                "part", self._part_name(xml_file), keys[xml_file]
+            )
+            if found:
+                results[xml_file] = value
+            else:
+                dirty.append(xml_file)
+
+        if self.jobs > 1 and len(dirty) > 1:
+            workers = min(self.jobs, len(dirty))
+            chunksize = max(1, len(dirty) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_part_worker,
+                initargs=(
+                    type(self),
+                    self.unpacked_dir,
+                    self.original_file,
+                    schema_registry.cache_dir,
+                    self.state.baseline_hashes if self.state else None,
+                ),
+            ) as executor:
+                checked = list(
+                    executor.map(_check_part_in_worker, dirty, chunksize=chunksize)
+                )
+        else:
+            checked = [self._check_part(xml_file) for xml_file in dirty]
+
+        for xml_file, value in zip(dirty, checked):
+            results[xml_file] = value
+            if self.state is not None:
+                self.state.store(
+                    "part", self._part_name(xml_file), keys[xml_file], value
+                )
+
+        self._part_results = {f: results[f] for f in self.xml_files}
+        return self._part_results
+
+    def _check_part(self, xml_file):
+        """Run every per-part check on a single file."""
+        return {
+            "unique_ids": self._collect_unique_ids(xml_file),
+            "relationship_ids": self._check_relationship_ids(xml_file),
+            "xsd": self._check_part_xsd(xml_file),
+        }
+
+    def _check_part_xsd(self, xml_file):
+        """XSD-validate a part, inheriting the baseline verdict if unchanged."""
+        if self.state is not None:
+            name = self._part_name(xml_file)
+            baseline_hash = self.state.baseline_hashes.get(name)
+            if baseline_hash is not None and baseline_hash == self._content_hash(
+                xml_file
+            ):
+                # Identical to the original part, so no new errors are possible
+                relative_path = Path(xml_file).relative_to(self.unpacked_dir)
+                if self._get_schema_path(relative_path):
+                    return True, set()
+                return None, set()
+        return self.validate_file_against_xsd(xml_file, verbose=False)
+
+    def _part_name(self, path):
+        """Return the package-relative posix name of a file."""
+        return Path(path).relative_to(self.unpacked_dir).as_posix()
+
+    def _get_rels_file(self, xml_file):
+        """Return the .rels file of a part (dir/_rels/file.xml.rels)."""
+        xml_file = Path(xml_file)
+        return xml_file.parent / "_rels" / f"{xml_file.name}.rels"
+
+    def _content_hash(self, path):
+        """Return the content hash of a file, or None if it does not exist."""
+        try:
+            return hash_content(self.trees.read_bytes(path))
+        except OSError:
+            return None
+
+    def _content_key(self, *paths):
+        """Return a key identifying the current content of the given files."""
+        return tuple(self._content_hash(path) for path in paths)
+
+    def _package_listing(self):
+        """Return the sorted names of all files in the package."""
+        return tuple(
+            sorted(
+                self._part_name(f) for f in self.unpacked_dir.rglob("*") if f.is_file()
+            )
+        )
+
+    def _cached_part_check(self, check, xml_file, compute, *depends_on):
+        """Run a per-part check, reusing the recorded result if inputs are unchanged.
+
+        Args:
+            check: Name of the check
+            xml_file: Part the check runs on
+            compute: Callable taking xml_file and returning the result
+            depends_on: Other files the result depends on
+
+        Returns:
+            The (possibly recorded) result of compute(xml_file)
+        """
+        if self.state is None:
+            return compute(xml_file)
+
+        key = self._content_key(xml_file, *depends_on)
+        name = self._part_name(xml_file)
+        found, value = self.state.lookup(check, name, key)
+        if not found:
+            value = compute(xml_file)
+            self.state.store(check, name, key, value)
+        return value
+
+    def _run_pass(self, check, get_key, method):
+        """Run a whole-package pass, replaying it if its inputs are unchanged.
+
+        Args:
+            check: Name of the pass
+            get_key: Callable returning a key for everything the pass depends on
+            method: Callable running the pass and returning bool
+        """
+        if self.state is None:
+            return method()
+        return self.state.run_pass(check, get_key(), method)
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            errors.extend(
+                self._cached_part_check("xml", xml_file, self._check_well_formed)
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -153,26 +321,33 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _check_well_formed(self, xml_file):
+        """Check that a single XML file is well-formed. Returns a list of errors."""
+        try:
+            # Try to parse the XML file
+            self.trees.parse(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            ]
+        except Exception as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            ]
+        return []
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            errors.extend(
+                self._cached_part_check(
+                    "namespaces", xml_file, self._check_namespaces
+                )
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -183,86 +358,58 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _check_namespaces(self, xml_file):
+        """Check Ignorable namespace declarations of a single file."""
+        errors = []
+        try:
+            root = self.trees.getroot(xml_file)
+            declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+            for attr_val in [
+                v for k, v in root.attrib.items() if k.endswith("Ignorable")
+            ]:
+                undeclared = set(attr_val.split()) - declared
+                errors.extend(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Namespace '{ns}' in Ignorable but not declared"
+                    for ns in sorted(undeclared)
+                )
+        except lxml.etree.XMLSyntaxError:
+            pass
+        return errors
+
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
+        part_results = self._get_part_results()
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            if part_results is not None:
+                events = part_results[xml_file]["unique_ids"]
+            else:
+                events = self._collect_unique_ids(xml_file)
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
+            # Global uniqueness spans files, so it is checked here in file order
+            for event in events:
+                if event[0] == "error":
+                    errors.append(event[1])
+                    continue
 
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                _, id_value, line, tag = event
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,10 +421,100 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _collect_unique_ids(self, xml_file):
+        """Check file-scoped ID uniqueness and collect globally scoped IDs.
+
+        Returns:
+            list: Events in document order, either ("error", message) or
+                ("global", id_value, line, tag) for IDs that must be unique
+                across all files
+        """
+        events = []
+
+        try:
+            root = self.trees.getroot(xml_file)
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Remove all mc:AlternateContent elements from a private copy
+            # of the tree (the pooled tree is shared with other passes)
+            mc_path = ".//mc:AlternateContent"
+            mc_namespaces = {"mc": self.MC_NAMESPACE}
+            if root.xpath(mc_path, namespaces=mc_namespaces):
+                root = self.trees.clone(xml_file).getroot()
+                for elem in root.xpath(mc_path, namespaces=mc_namespaces):
+                    elem.getparent().remove(elem)
+
+            # Now check IDs in the cleaned tree
+            for elem in root.iter():
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            events.append(("global", id_value, elem.sourceline, tag))
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                events.append(
+                                    (
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    )
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            events.append(
+                ("error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+            )
+
+        return events
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
+        return self._run_pass(
+            "file_references", self._file_references_key, self._validate_file_references
+        )
+
+    def _file_references_key(self):
+        """Return everything the relationship target check depends on."""
+        rels_files = sorted(self.unpacked_dir.rglob("*.rels"))
+        return (
+            tuple(self._part_name(f) for f in rels_files),
+            self._content_key(*rels_files),
+            self._package_listing(),
+        )
+
+    def _validate_file_references(self):
+        """Check relationship targets of all .rels files (uncached)."""
         errors = []
 
         # Find all .rels files
@@ -310,7 +547,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.trees.getroot(rels_file)
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -390,87 +627,15 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
+        part_results = self._get_part_results()
 
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
-
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
-                continue
-
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+            if part_results is not None:
+                errors.extend(part_results[xml_file]["relationship_ids"])
+            else:
+                errors.extend(self._check_relationship_ids(xml_file))
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -483,6 +648,92 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _check_relationship_ids(self, xml_file):
+        """Check r:id references of a single XML file against its .rels file.
+
+        Returns:
+            list: Error messages for this file
+        """
+        errors = []
+
+        # Skip .rels files themselves
+        if xml_file.suffix == ".rels":
+            return errors
+
+        # Determine the corresponding .rels file
+        # For dir/file.xml, it's dir/_rels/file.xml.rels
+        rels_dir = xml_file.parent / "_rels"
+        rels_file = rels_dir / f"{xml_file.name}.rels"
+
+        # Skip if there's no corresponding .rels file (that's okay)
+        if not rels_file.exists():
+            return errors
+
+        try:
+            # Parse the .rels file to get valid relationship IDs and their types
+            rels_root = self.trees.getroot(rels_file)
+            rid_to_type = {}
+
+            for rel in rels_root.findall(
+                f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                rid = rel.get("Id")
+                rel_type = rel.get("Type", "")
+                if rid:
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                        errors.append(
+                            f"  {rels_rel_path}: Line {rel.sourceline}: "
+                            f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                        )
+                    # Extract just the type name from the full URL
+                    type_name = (
+                        rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    )
+                    rid_to_type[rid] = type_name
+
+            # Parse the XML file to find all r:id references
+            xml_root = self.trees.getroot(xml_file)
+
+            # Find all elements with r:id attributes
+            for elem in xml_root.iter():
+                # Check for r:id attribute (relationship ID)
+                rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                if rid_attr:
+                    xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+                    elem_name = (
+                        elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                    )
+
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_rel_path}: Line {elem.sourceline}: "
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(
+                            elem_name
+                        )
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_rel_path}: Line {elem.sourceline}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
+
+        except Exception as e:
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            errors.append(f"  Error processing {xml_rel_path}: {e}")
+
+        return errors
+
     def _get_expected_relationship_type(self, element_name):
         """
         Get the expected relationship type for an element.
@@ -521,6 +772,33 @@ class BaseSchemaValidator:
 
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
+        return self._run_pass(
+            "content_types", self._content_types_key, self._validate_content_types
+        )
+
+    def _content_types_key(self):
+        """Return everything the content type declaration check depends on."""
+        root_tags = []
+        for xml_file in self.xml_files:
+            try:
+                root_tags.append(
+                    self._cached_part_check("root_tag", xml_file, self._get_root_tag)
+                )
+            except Exception:
+                root_tags.append(None)
+        return (
+            self._content_key(self.unpacked_dir / "[Content_Types].xml"),
+            self._package_listing(),
+            tuple(self._part_name(f) for f in self.xml_files),
+            tuple(root_tags),
+        )
+
+    def _get_root_tag(self, xml_file):
+        """Return the root element tag of a single file."""
+        return self.trees.getroot(xml_file).tag
+
+    def _validate_content_types(self):
+        """Check content type declarations of all parts (uncached)."""
         errors = []
 
         # Find [Content_Types].xml file
@@ -531,7 +809,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self.trees.getroot(content_types_file)
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,7 +871,9 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._cached_part_check(
+                        "root_tag", xml_file, self._get_root_tag
+                    )
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -673,7 +953,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +972,16 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
+        part_results = self._get_part_results()
+
         for xml_file in self.xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
+            if part_results is not None:
+                is_valid, new_file_errors = part_results[xml_file]["xsd"]
+            else:
+                is_valid, new_file_errors = self.validate_file_against_xsd(
+                    xml_file, verbose=False
+                )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,7 +997,7 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -825,43 +1110,79 @@ class BaseSchemaValidator:
 
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
-        schema_path = self._get_schema_path(xml_file)
+        relative_path = Path(xml_file).relative_to(base_path)
+        if not self._get_schema_path(relative_path):
+            return None, None  # Skip file
+
+        try:
+            xml_doc = self.trees.parse(xml_file)
+            # Raw bytes are only needed to key the on-disk result cache
+            content = (
+                self.trees.read_bytes(xml_file) if schema_registry.cache_dir else None
+            )
+        except Exception as e:
+            return False, {str(e)}
+
+        return self._validate_xsd_content(relative_path, content, xml_doc)
+
+    def _validate_xsd_content(self, relative_path, content, xml_doc=None):
+        """Validate XML content of a part against XSD schema.
+
+        Args:
+            relative_path: Path of the part relative to the package root
+            content: Raw bytes of the part (may be None if xml_doc is given)
+            xml_doc: Already parsed tree of the part; it is not modified
+
+        Returns:
+            tuple: (is_valid, errors_set), or (None, None) if no schema applies
+        """
+        schema_path = self._get_schema_path(relative_path)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Namespace cleaning only applies to main content folders
+            clean_namespaces = bool(
+                relative_path.parts
+                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+            )
+            variant = "clean" if clean_namespaces else "raw"
+
+            # Reuse a result from the on-disk cache if enabled
+            if content is not None:
+                cached = schema_registry.lookup_result(schema_path, content, variant)
+                if cached is not None:
+                    return cached
+
+            # Compiled once per process and shared across parts
+            schema = schema_registry.get_schema(schema_path)
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load and preprocess XML (preprocessing works on a copy)
+            if xml_doc is None:
+                xml_doc = lxml.etree.ElementTree(lxml.etree.fromstring(content))
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
+            if clean_namespaces:
                 xml_doc = self._clean_ignorable_namespaces(xml_doc)
 
             # Validate
             if schema.validate(xml_doc):
-                return True, set()
+                is_valid, errors = True, set()
             else:
                 errors = set()
                 for error in schema.error_log:
                     # Store normalized error message (without line numbers for comparison)
                     errors.add(error.message)
-                return False, errors
+                is_valid = False
+
+            if content is not None:
+                schema_registry.store_result(
+                    schema_path, content, variant, is_valid, errors
+                )
+            return is_valid, errors
 
         except Exception as e:
             return False, {str(e)}
@@ -869,39 +1190,21 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The part is read straight from the original archive and its errors are
+        memoized by the baseline, so each original part is validated at most once.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        return self.baseline.part_errors(relative_path, self._validate_xsd_content)
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -947,5 +1250,27 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+# Validator owned by a worker process of the per-part process pool
+_worker_validator = None
+
+
+def _init_part_worker(
+    validator_class, unpacked_dir, original_file, cache_dir, baseline_hashes
+):
+    """Create the validator used by this worker process."""
+    global _worker_validator
+    if cache_dir:
+        schema_registry.enable_disk_cache(cache_dir)
+    state = ValidationState(baseline_hashes) if baseline_hashes is not None else None
+    _worker_validator = validator_class(
+        unpacked_dir, original_file, verbose=False, state=state
+    )
+
+
+def _check_part_in_worker(xml_file):
+    """Run the per-part checks for xml_file in a worker process."""
+    return _worker_validator._check_part(xml_file)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -3,8 +3,6 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
@@ -80,36 +78,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_check(
+                    "whitespace", xml_file, self._check_whitespace_preservation
                 )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -121,6 +94,43 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    def _check_whitespace_preservation(self, xml_file):
+        """Check w:t whitespace preservation in a single file. Returns a list of errors."""
+        errors = []
+
+        try:
+            root = self.trees.getroot(xml_file)
+
+            # Find all w:t elements
+            for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
+                if elem.text:
+                    text = elem.text
+                    # Check if text starts or ends with whitespace
+                    if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+                        # Check if xml:space="preserve" attribute exists
+                        xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+                        if (
+                            xml_space_attr not in elem.attrib
+                            or elem.attrib[xml_space_attr] != "preserve"
+                        ):
+                            # Show a preview of the text
+                            text_preview = (
+                                repr(text)[:50] + "..."
+                                if len(repr(text)) > 50
+                                else repr(text)
+                            )
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                            )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+
+        return errors
+
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
@@ -133,32 +143,9 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(
+                self._cached_part_check("deletions", xml_file, self._check_deletions)
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -170,6 +157,39 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:t elements found within w:del elements")
             return True
 
+    def _check_deletions(self, xml_file):
+        """Check a single file for w:t within w:del. Returns a list of errors."""
+        errors = []
+
+        try:
+            root = self.trees.getroot(xml_file)
+
+            # Find all w:t elements that are descendants of w:del elements
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+            xpath_expression = ".//w:del//w:t"
+            problematic_t_elements = root.xpath(
+                xpath_expression, namespaces=namespaces
+            )
+            for t_elem in problematic_t_elements:
+                if t_elem.text:
+                    # Show a preview of the text
+                    text_preview = (
+                        repr(t_elem.text)[:50] + "..."
+                        if len(repr(t_elem.text)) > 50
+                        else repr(t_elem.text)
+                    )
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                    )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+
+        return errors
+
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
@@ -180,7 +200,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.getroot(xml_file)
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,19 +214,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Read document.xml straight from the original archive
+            content = self.baseline.read("word/document.xml")
+            root = lxml.etree.fromstring(content)
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -224,31 +238,9 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(
+                self._cached_part_check("insertions", xml_file, self._check_insertions)
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -260,8 +252,58 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    def _check_insertions(self, xml_file):
+        """Check a single file for w:delText within w:ins. Returns a list of errors."""
+        errors = []
+
+        try:
+            root = self.trees.getroot(xml_file)
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+
+            # Find w:delText in w:ins that are NOT within w:del
+            invalid_elements = root.xpath(
+                ".//w:ins//w:delText[not(ancestor::w:del)]",
+                namespaces=namespaces
+            )
+
+            for elem in invalid_elements:
+                text_preview = (
+                    repr(elem.text or "")[:50] + "..."
+                    if len(repr(elem.text or "")) > 50
+                    else repr(elem.text or "")
+                )
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+
+        return errors
+
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
+        self._run_pass(
+            "paragraph_counts",
+            self._paragraph_counts_key,
+            self._compare_paragraph_counts,
+        )
+
+    def _paragraph_counts_key(self):
+        """Return everything the paragraph count comparison depends on."""
+        document_files = [f for f in self.xml_files if f.name == "document.xml"]
+        return (
+            str(self.original_file.resolve()),
+            self.original_file.stat().st_mtime_ns,
+            tuple(self._part_name(f) for f in document_files),
+            self._content_key(*document_files),
+        )
+
+    def _compare_paragraph_counts(self):
+        """Print paragraph counts of the original and new document (uncached)."""
         original_count = self.count_paragraphs_in_original()
         new_count = self.count_paragraphs_in_unpacked()
 
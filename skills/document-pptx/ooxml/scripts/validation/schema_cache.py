@@ -0,0 +1,139 @@
+"""
+Process-wide cache of compiled XSD schemas shared by all validators.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import lxml.etree
+
+
+class SchemaRegistry:
+    """Registry of compiled XSD schemas keyed by schema path and mtime.
+
+    Compiling the OOXML schemas (wml.xsd pulls in most of the DrawingML
+    schemas) is far more expensive than validating a single part, so each
+    schema is compiled at most once per process and shared by every validator
+    and every part.
+
+    An optional on-disk warm cache remembers validation results keyed by the
+    schema and the exact part content. Compiled schemas cannot be serialized,
+    so the disk cache stores verdicts instead: a repeated run over unchanged
+    parts never needs to compile the schema at all.
+    """
+
+    # Bump when the preprocessing applied before validation changes, so that
+    # results cached by older code are not reused.
+    CACHE_VERSION = "1"
+
+    def __init__(self, cache_dir=None):
+        self._schemas = {}
+        self._lock = threading.Lock()
+        self.cache_dir = None
+        if cache_dir:
+            self.enable_disk_cache(cache_dir)
+
+    def enable_disk_cache(self, cache_dir):
+        """Persist validation results under cache_dir across runs."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def disable_disk_cache(self):
+        """Stop reading and writing the on-disk result cache."""
+        self.cache_dir = None
+
+    def clear(self):
+        """Drop all compiled schemas held in memory."""
+        with self._lock:
+            self._schemas.clear()
+
+    def get_schema(self, schema_path):
+        """Return the compiled schema for schema_path, compiling it on first use.
+
+        Args:
+            schema_path: Path to the .xsd file
+
+        Returns:
+            lxml.etree.XMLSchema: The compiled schema
+        """
+        key = self._schema_key(schema_path)
+        schema = self._schemas.get(key)
+        if schema is not None:
+            return schema
+
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is None:
+                with open(key[0], "rb") as xsd_file:
+                    parser = lxml.etree.XMLParser()
+                    xsd_doc = lxml.etree.parse(
+                        xsd_file, parser=parser, base_url=key[0]
+                    )
+                    schema = lxml.etree.XMLSchema(xsd_doc)
+                # Drop schemas compiled from an older version of the same file
+                for stale in [k for k in self._schemas if k[0] == key[0]]:
+                    del self._schemas[stale]
+                self._schemas[key] = schema
+        return schema
+
+    def lookup_result(self, schema_path, content, variant=""):
+        """Look up a cached validation result for a part.
+
+        Args:
+            schema_path: Path to the .xsd file the part is validated against
+            content: Raw bytes of the XML part
+            variant: Extra discriminator for preprocessing applied to the part
+
+        Returns:
+            tuple: (is_valid, errors_set), or None if not cached
+        """
+        if self.cache_dir is None:
+            return None
+
+        cache_file = self._result_file(schema_path, content, variant)
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            return data["valid"], set(data["errors"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store_result(self, schema_path, content, variant, is_valid, errors):
+        """Store a validation result for a part in the on-disk cache."""
+        if self.cache_dir is None:
+            return
+
+        cache_file = self._result_file(schema_path, content, variant)
+        data = {"valid": bool(is_valid), "errors": sorted(errors)}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(".tmp")
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            temp_file.replace(cache_file)
+        except OSError:
+            pass  # The cache is an optimization only
+
+    def _schema_key(self, schema_path):
+        """Return (resolved path, mtime) identifying a schema version."""
+        schema_path = Path(schema_path).resolve()
+        return str(schema_path), schema_path.stat().st_mtime_ns
+
+    def _result_file(self, schema_path, content, variant):
+        """Return the cache file path for a (schema, content, variant) key."""
+        schema_file, mtime = self._schema_key(schema_path)
+        digest = hashlib.sha256()
+        digest.update(
+            f"{self.CACHE_VERSION}\0{schema_file}\0{mtime}\0{variant}\0".encode()
+        )
+        digest.update(content)
+        key = digest.hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+
+# Shared by every validator in this process
+schema_registry = SchemaRegistry()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -13,6 +13,8 @@ This module provides functionality to:
 Classes:
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
+    FontIndex: Font files of the platform font directories, listed once
+    TextMeasurer: Measures and wraps text in one font, with caching
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
@@ -23,9 +25,14 @@ Usage:
 """
 
 import argparse
+import bisect
+import functools
+import heapq
 import json
+import os
 import platform
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -46,6 +53,29 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+# Font directories and font file extensions searched by platform
+FONT_DIRS = {
+    "Darwin": ["/System/Library/Fonts/", "/Library/Fonts/", "~/Library/Fonts/"],
+    "Linux": ["/usr/share/fonts/truetype/", "/usr/local/share/fonts/", "~/.fonts/"],
+}
+FONT_EXTENSIONS = {
+    "Darwin": [".ttf", ".otf", ".ttc", ".dfont"],
+    "Linux": [".ttf", ".otf"],
+}
+
+# Number of loaded fonts (one per file and size) kept in memory
+FONT_CACHE_SIZE = 64
+
+# Number of wrapped lines memoized per font
+WRAP_CACHE_SIZE = 4096
+
+# Factor on summed character advances covering kerning and ligatures when
+# bounding text widths without measuring the text
+KERNING_MARGIN = 1.1
+
+# Minimum overlap in inches (both ways) for two shapes to count as overlapping
+OVERLAP_TOLERANCE = 0.05
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -60,6 +90,9 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --workers 4
+    Processes slides in 4 worker processes (same output, faster on large decks)
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +109,12 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes extracting slides (0 = one per CPU)",
+    )
 
     args = parser.parse_args()
 
@@ -94,11 +133,13 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        inventory = get_inventory_as_dict(
+            input_path, issues_only=args.issues_only, workers=args.workers
+        )
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        _write_inventory_json(inventory, output_path)
 
         print(f"Output saved to: {args.output}")
 
@@ -263,6 +304,228 @@ class ParagraphData:
         return result
 
 
+class FontIndex:
+    """Font files of a list of font directories, listed once.
+
+    Lookups give the same result as probing each directory for every name
+    variant and extension and then scanning it for a file containing the
+    name, but from the in-memory listing and memoized per font name.
+    """
+
+    def __init__(
+        self, font_dirs: List[str], extensions: List[str], case_sensitive: bool = True
+    ):
+        """Initialize by listing the font directories.
+
+        Args:
+            font_dirs: Directories to search, in order (~ is expanded)
+            extensions: Font file extensions to accept
+            case_sensitive: Whether file names are case sensitive (False on macOS)
+        """
+        self.extensions = tuple(extensions)
+        self.case_sensitive = case_sensitive
+        # (entry names, [(lowercase file name, path)]) per existing directory
+        self.directories: List[Tuple[Dict[str, str], List[Tuple[str, str]]]] = []
+        for font_dir in font_dirs:
+            font_dir_path = Path(font_dir).expanduser()
+            try:
+                with os.scandir(font_dir_path) as entries:
+                    names = {}
+                    files = []
+                    for entry in entries:
+                        font_path = str(font_dir_path / entry.name)
+                        name = entry.name if case_sensitive else entry.name.lower()
+                        names.setdefault(name, font_path)
+                        if entry.is_file():
+                            files.append((entry.name.lower(), font_path))
+            except (OSError, PermissionError):
+                continue
+            self.directories.append((names, files))
+        self._found: Dict[str, Optional[str]] = {}
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Get the font file path for a font name, or None if not found."""
+        if font_name not in self._found:
+            self._found[font_name] = self._find(font_name)
+        return self._found[font_name]
+
+    def _find(self, font_name: str) -> Optional[str]:
+        """Search the listed directories for a font name."""
+        # Common font file variations to try
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        for names, files in self.directories:
+            # First try exact matches
+            for variant in font_variations:
+                for ext in self.extensions:
+                    name = f"{variant}{ext}"
+                    font_path = names.get(name if self.case_sensitive else name.lower())
+                    if font_path:
+                        return font_path
+
+            # Then try fuzzy matching - find files containing the font name
+            for file_name_lower, font_path in files:
+                if font_name_lower in file_name_lower and file_name_lower.endswith(
+                    self.extensions
+                ):
+                    return font_path
+
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_font_index() -> FontIndex:
+    """Return the font index of this platform, built on first use."""
+    system = "Darwin" if platform.system() == "Darwin" else "Linux"
+    return FontIndex(
+        FONT_DIRS[system], FONT_EXTENSIONS[system], case_sensitive=system != "Darwin"
+    )
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(font_path: Optional[str], size: int) -> Any:
+    """Load a font file at a size, falling back to PIL's default font.
+
+    Loaded fonts are kept in an LRU cache keyed by (font_path, size).
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+class TextMeasurer:
+    """Measures and wraps text in one font, caching what it has measured.
+
+    Word widths are cached, and each line break is estimated from prefix sums
+    of word widths, then confirmed with exact measurements of the line around
+    it, instead of measuring every word prefix. Wrapped lines are memoized
+    per (text, width), so repeated paragraphs are only wrapped once.
+    """
+
+    def __init__(self, font: Any):
+        """Initialize with the font to measure in.
+
+        Args:
+            font: PIL font (FreeTypeFont or default font)
+        """
+        self.font = font
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        self._word_widths: Dict[str, float] = {}
+        self.wrap = functools.lru_cache(maxsize=WRAP_CACHE_SIZE)(self._wrap)
+
+    def length(self, text: str) -> float:
+        """Return the advance width of text in pixels."""
+        return self._draw.textlength(text, font=self.font)
+
+    def word_width(self, word: str) -> float:
+        """Return the advance width of a single word (cached)."""
+        width = self._word_widths.get(word)
+        if width is None:
+            width = self._word_widths[word] = self.length(word)
+        return width
+
+    def max_lines(self, line: str, max_width_px: int) -> int:
+        """Return an upper bound of len(wrap(line, max_width_px)) without wrapping.
+
+        Each wrapped line but the last is wider than max_width_px less a space
+        and the first word of the next line, so n lines hold at least n - 1
+        such widths. Text widths are bounded by the sum of the (cached)
+        character advances plus a margin for kerning. A line also never has
+        more wrapped lines than words.
+        """
+        if not line:
+            return 1
+        words = [word for word in line.split(" ") if word]
+        if len(words) <= 1:
+            return 1
+
+        word_widths = [self._chars_width(word) for word in words]
+        text_width = sum(word_widths) + (len(line) - sum(map(len, words))) * (
+            self._chars_width(" ")
+        )
+        min_line_width = max_width_px - self._chars_width(" ") - max(word_widths)
+        if min_line_width <= 0:
+            return len(words)
+        return min(len(words), int(text_width / min_line_width) + 1)
+
+    def _chars_width(self, text: str) -> float:
+        """Return an upper estimate of the width of text from character advances."""
+        width = 0.0
+        for char in text:
+            width += self.word_width(char)
+        return width * KERNING_MARGIN
+
+    def _wrap(self, line: str, max_width_px: int) -> Tuple[str, ...]:
+        """Wrap a single line of text to fit within max_width_px.
+
+        Words are added to a line while the line fits; a word wider than
+        max_width_px gets a line of its own, and empty words (from repeated
+        spaces) at the start of a line are dropped.
+        """
+        if not line:
+            return ("",)
+
+        if self.length(line) <= max_width_px:
+            return (line,)
+
+        # Need to wrap - split into words
+        words = line.split(" ")
+        space = self.word_width(" ")
+
+        # ends[k]: estimated right edge of words[k] when words[0:k + 1] are
+        # laid out on one line, so words[i:k + 1] are about
+        # ends[k] - starts[i] wide
+        ends = []
+        starts = []
+        position = 0.0
+        for k, word in enumerate(words):
+            starts.append(position)
+            position += self.word_width(word)
+            ends.append(position)
+            position += space
+
+        wrapped = []
+        start = 0
+        while start < len(words):
+            if not words[start]:
+                start += 1
+                continue
+
+            # Estimate the last word that fits, then confirm it exactly
+            end = bisect.bisect_right(ends, starts[start] + max_width_px) - 1
+            end = max(end, start)
+            while end > start and self._too_wide(words, start, end, max_width_px):
+                end -= 1
+            while end + 1 < len(words) and not self._too_wide(
+                words, start, end + 1, max_width_px
+            ):
+                end += 1
+
+            wrapped.append(" ".join(words[start : end + 1]))
+            start = end + 1
+
+        return tuple(wrapped)
+
+    def _too_wide(self, words: List[str], start: int, end: int, max_width_px: int):
+        """Check whether words[start:end + 1] on one line exceed max_width_px."""
+        return self.length(" ".join(words[start : end + 1])) > max_width_px
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def get_text_measurer(font_path: Optional[str], size: int) -> TextMeasurer:
+    """Return the (cached) TextMeasurer of a font file at a size."""
+    return TextMeasurer(load_font(font_path, size))
+
+
 class ShapeData:
     """Data structure for shape properties extracted from a PowerPoint shape."""
 
@@ -286,61 +549,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_index().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -391,6 +600,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        measure_text: bool = True,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,6 +609,8 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            measure_text: If False, frame overflow is not estimated (see
+                extract_slide_inventory)
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
@@ -461,7 +673,9 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
-        self._estimate_frame_overflow()
+        self._text_paragraphs: Optional[List[Tuple[int, str, ParagraphData, int]]] = None
+        if measure_text:
+            self._estimate_frame_overflow()
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
@@ -531,85 +745,55 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
+    def _estimate_frame_overflow(self) -> None:
+        """Estimate if text overflows the shape bounds using PIL text measurement."""
+        self.frame_overflow_bottom = self._get_frame_overflow()
 
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
+    def _may_overflow_frame(self) -> bool:
+        """Check whether the text could overflow the shape bounds at all.
 
-        if current_line:
-            wrapped.append(current_line)
+        Bounds the wrapped lines from character advances instead of wrapping
+        the text (see TextMeasurer.max_lines), so it does not miss overflows
+        that _estimate_frame_overflow would find.
+        """
+        return self._get_frame_overflow(upper_bound=True) is not None
 
-        return wrapped
+    def _get_frame_overflow(self, upper_bound: bool = False) -> Optional[float]:
+        """Return the significant overflow of the text in inches, or None.
 
-    def _estimate_frame_overflow(self) -> None:
-        """Estimate if text overflows the shape bounds using PIL text measurement."""
+        Args:
+            upper_bound: If True, bound the number of wrapped lines from
+                character advances instead of wrapping the text
+        """
         if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
+            return None
 
         text_frame = self.shape.text_frame  # type: ignore
         if not text_frame or not text_frame.paragraphs:
-            return
+            return None
 
         # Get usable dimensions after accounting for margins
         usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
         if usable_width_px <= 0 or usable_height_px <= 0:
-            return
-
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
-        # Get default font size from placeholder or use conservative estimate
-        default_font_size = self._get_default_font_size()
+            return None
 
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
+        for para_idx, text, para_data, font_size in self._get_text_paragraphs():
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
-            font_size = int(para_data.font_size or default_font_size)
-
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            measurer = get_text_measurer(self.get_font_path(font_name), font_size)
 
             # Wrap all lines in this paragraph
-            all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
-                all_wrapped_lines.extend(wrapped)
+            wrapped_line_count = 0
+            for line in text.split("\n"):
+                if upper_bound:
+                    wrapped_line_count += measurer.max_lines(line, usable_width_px)
+                else:
+                    wrapped_line_count += len(measurer.wrap(line, usable_width_px))
 
-            if all_wrapped_lines:
+            if wrapped_line_count:
                 # Calculate line height
                 if para_data.line_spacing:
                     # Custom line spacing explicitly set
@@ -623,7 +807,7 @@ class ShapeData:
                     total_height_px += para_data.space_before * 96 / 72
 
                 # Add paragraph text height
-                total_height_px += len(all_wrapped_lines) * line_height_px
+                total_height_px += wrapped_line_count * line_height_px
 
                 # Add space_after
                 if para_data.space_after:
@@ -634,7 +818,26 @@ class ShapeData:
             overflow_px = total_height_px - usable_height_px
             overflow_inches = round(overflow_px / 96.0, 2)
             if overflow_inches > 0.05:  # Only report significant overflows
-                self.frame_overflow_bottom = overflow_inches
+                return overflow_inches
+        return None
+
+    def _get_text_paragraphs(self) -> List[Tuple[int, str, ParagraphData, int]]:
+        """Return (index, text, ParagraphData, font size) of non-empty paragraphs.
+
+        Computed once per shape, for both overflow estimates.
+        """
+        if self._text_paragraphs is None:
+            # Get default font size from placeholder or use conservative estimate
+            default_font_size = self._get_default_font_size()
+            self._text_paragraphs = []
+            for para_idx, paragraph in enumerate(self.shape.text_frame.paragraphs):  # type: ignore
+                text = paragraph.text
+                if not text.strip():
+                    continue
+                para_data = ParagraphData(paragraph)
+                font_size = int(para_data.font_size or default_font_size)
+                self._text_paragraphs.append((para_idx, text, para_data, font_size))
+        return self._text_paragraphs
 
     def _calculate_slide_overflow(self) -> None:
         """Calculate if shape overflows the slide boundaries."""
@@ -849,7 +1052,7 @@ def sort_shapes_by_position(shapes: List[ShapeData]) -> List[ShapeData]:
 def calculate_overlap(
     rect1: Tuple[float, float, float, float],
     rect2: Tuple[float, float, float, float],
-    tolerance: float = 0.05,
+    tolerance: float = OVERLAP_TOLERANCE,
 ) -> Tuple[bool, float]:
     """Calculate if and how much two rectangles overlap.
 
@@ -888,27 +1091,32 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
-
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
-
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
-
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
-
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
-
+    # Ensure shape IDs are set
+    for i, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(s.left, s.top, s.width, s.height) for s in shapes]
+
+    # Sweep from left to right. A shape can only overlap shapes whose right
+    # edge is still more than the tolerance past its left edge, so only those
+    # are kept (in a heap by right edge) and compared, instead of every pair.
+    pairs = []
+    active: List[Tuple[float, int]] = []
+    for j in sorted(range(len(shapes)), key=lambda index: rects[index][0]):
+        left, _, width, _ = rects[j]
+        while active and active[0][0] - left <= OVERLAP_TOLERANCE:
+            heapq.heappop(active)
+        for _, i in active:
+            overlaps, overlap_area = calculate_overlap(rects[i], rects[j])
             if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+                pairs.append((min(i, j), max(i, j), overlap_area))
+        heapq.heappush(active, (left + width, j))
+
+    # Record overlaps in pair order, as a comparison of every pair would
+    for i, j, overlap_area in sorted(pairs):
+        # Add shape IDs with overlap area in square inches
+        shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+        shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
 
 
 def extract_text_inventory(
@@ -931,50 +1139,71 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
-
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
-
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
-
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+        shapes = extract_slide_inventory(slide, issues_only=issues_only)
+        if shapes:
+            inventory[f"slide-{slide_idx}"] = shapes
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
-
-        if not sorted_shapes:
-            continue
+    return inventory
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
 
-    return inventory
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False
+) -> Dict[str, "ShapeData"]:
+    """Extract the text shapes of a single slide.
 
+    Args:
+        slide: Slide object
+        issues_only: If True, only include shapes that have overflow or overlap issues
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+    Returns:
+        Dict of shape_id -> ShapeData, sorted by visual position (empty if the
+        slide has no text shapes)
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            measure_text=not issues_only,
+        )
+        for swp in shapes_with_positions
+    ]
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        # Text is only measured where it matters: shapes reported for other
+        # issues anyway, and shapes whose text could overflow by character advances
+        for shape_data in sorted_shapes:
+            if shape_data.has_any_issues or shape_data._may_overflow_frame():
+                shape_data._estimate_frame_overflow()
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, workers: int = 1
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,10 +1213,16 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes extracting slides (0 = one per CPU).
+            The result is the same as with a single process.
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
+    workers = workers if workers else (os.cpu_count() or 1)
+    if workers > 1:
+        return _extract_inventory_in_workers(pptx_path, issues_only, workers)
+
     inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
 
     # Convert ShapeData objects to dictionaries
@@ -1012,9 +1247,60 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
 
+    _write_inventory_json(json_inventory, output_path)
+
+
+def _write_inventory_json(json_inventory: InventoryDict, output_path: Path) -> None:
+    """Write a JSON-serializable inventory to a file."""
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)
 
 
+def _extract_inventory_in_workers(
+    pptx_path: Path, issues_only: bool, workers: int
+) -> InventoryDict:
+    """Extract the inventory of each slide in a process pool (see get_inventory_as_dict)."""
+    slide_count = len(Presentation(str(pptx_path)).slides)
+    if slide_count == 0:
+        return {}
+
+    workers = min(workers, slide_count)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path), issues_only),
+    ) as executor:
+        results = executor.map(
+            _extract_slide_in_worker,
+            range(slide_count),
+            chunksize=max(1, slide_count // (workers * 4)),
+        )
+        # Results arrive in slide order; shape IDs are assigned per slide
+        return {
+            f"slide-{slide_idx}": shapes
+            for slide_idx, shapes in enumerate(results)
+            if shapes
+        }
+
+
+# Presentation opened once per worker process
+_worker_prs = None
+_worker_issues_only = False
+
+
+def _init_inventory_worker(pptx_path: str, issues_only: bool) -> None:
+    """Open the presentation in a worker process of the inventory pool."""
+    global _worker_prs, _worker_issues_only
+    _worker_prs = Presentation(pptx_path)
+    _worker_issues_only = issues_only
+
+
+def _extract_slide_in_worker(slide_idx: int) -> Dict[str, ShapeDict]:
+    """Extract one slide in a worker process of the inventory pool."""
+    slide = _worker_prs.slides[slide_idx]  # type: ignore
+    shapes = extract_slide_inventory(slide, issues_only=_worker_issues_only)
+    return {shape_id: shape_data.to_dict() for shape_id, shape_data in shapes.items()}
+
+
 if __name__ == "__main__":
     main()
@@ -10,13 +10,45 @@ Slides can be repeated (e.g., 34 appears twice).
 """
 
 import argparse
-import shutil
+import posixpath
+import re
 import sys
+import uuid
+import zipfile
 from copy import deepcopy
 from pathlib import Path
 
-import six
-from pptx import Presentation
+# Shared with the ooxml scripts (raw copies of zip members)
+sys.path.append(str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+
+import lxml.etree
+from pack import can_copy_raw, copy_raw_member
+
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+P14_NS = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+SLIDE_RELATIONSHIP = R_NS + "/slide"
+PRESENTATION_PART = "ppt/presentation.xml"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+# Relationships a duplicated slide shares with its source instead of copying
+# the target part (relationship type suffixes)
+SHARED_RELATIONSHIPS = (
+    "/slideLayout",
+    "/slide",
+    "/image",
+    "/media",
+    "/video",
+    "/audio",
+    "/hdphoto",
+)
+
+# Relationships a duplicated slide does not inherit: notes and comments
+# belong to exactly one slide
+DROPPED_RELATIONSHIPS = ("/notesSlide", "/comments")
 
 
 def main():
@@ -72,159 +104,430 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
-def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+class SlidePackage:
+    """A .pptx package edited at the level of its parts and relationships.
+
+    Slides are never parsed: duplicating a slide copies its XML part as-is
+    and gives it its own relationships, which keep pointing at the same
+    layout and media parts. Only presentation.xml, [Content_Types].xml and
+    the relationship parts of touched parts are rewritten. save() drops
+    every part no longer reachable from the package relationships and
+    streams all other members into the output without recompressing them.
+    """
+
+    def __init__(self, path):
+        self._zip = zipfile.ZipFile(path)
+        self._names = set(self._zip.namelist())
+        self._presentation = self._read_xml(PRESENTATION_PART)
+        self._content_types = self._read_xml(CONTENT_TYPES_PART)
+        self._rels = {}  # Part name -> edited relationships
+        self._copies = {}  # New part name -> part it is a copy of
+        self._sections = self._slide_sections()
+        self._next_slide_id = 1 + max(
+            (int(slide_id.get("id")) for slide_id in self.slide_ids), default=255
+        )
+
+    def close(self):
+        self._zip.close()
+
+    @property
+    def slide_ids(self):
+        """Return the p:sldId elements of the presentation in slide order."""
+        slide_list = self._presentation.find(f"{{{P_NS}}}sldIdLst")
+        return [] if slide_list is None else list(slide_list)
+
+    def slide_part(self, slide_id):
+        """Return the part name of the slide a p:sldId element refers to."""
+        rid = slide_id.get(f"{{{R_NS}}}id")
+        for rel in self._read_relationships(PRESENTATION_PART):
+            if rel.get("Id") == rid:
+                return self._target(PRESENTATION_PART, rel)
+        raise ValueError(f"Slide relationship {rid} not found")
+
+    def duplicate_slide(self, slide_id):
+        """Add a copy of a slide to the package and return its new p:sldId.
+
+        The copy shares layout, media and links to other slides with the
+        source slide; charts, diagrams, embedded objects and other parts
+        owned by the slide are copied. Notes and comments are not copied.
+        The returned element is not part of the slide list yet.
+        """
+        slide_name = self._copy_part(self.slide_part(slide_id), {})
+        rid = self._add_relationship(
+            PRESENTATION_PART, SLIDE_RELATIONSHIP, slide_name
+        )
+        new_id = lxml.etree.Element(f"{{{P_NS}}}sldId")
+        new_id.set("id", str(self._next_slide_id))
+        new_id.set(f"{{{R_NS}}}id", rid)
+        self._next_slide_id += 1
+
+        # Place the copy in the section of its source slide
+        section = self._sections.get(slide_id.get("id"))
+        if section is not None:
+            self._sections[new_id.get("id")] = section
+        return new_id
+
+    def set_slides(self, slide_ids):
+        """Make slide_ids (existing or duplicated p:sldId elements) the slide list.
+
+        Relationships to slides left out are removed from the presentation,
+        along with their entries in custom shows; their parts are dropped on
+        save unless another kept part still refers to them.
+        """
+        slide_list = self._presentation.find(f"{{{P_NS}}}sldIdLst")
+        kept_rids = {slide_id.get(f"{{{R_NS}}}id") for slide_id in slide_ids}
+        for slide_id in list(slide_list):
+            slide_list.remove(slide_id)
+        slide_list.extend(slide_ids)
+
+        rels = self._relationships(PRESENTATION_PART)
+        for rel in list(rels):
+            if rel.get("Type") == SLIDE_RELATIONSHIP and rel.get("Id") not in kept_rids:
+                rels.remove(rel)
+
+        for show_slide in self._presentation.iterfind(
+            f"{{{P_NS}}}custShowLst/{{{P_NS}}}custShow/{{{P_NS}}}sldLst/{{{P_NS}}}sld"
+        ):
+            if show_slide.get(f"{{{R_NS}}}id") not in kept_rids:
+                show_slide.getparent().remove(show_slide)
+
+        self._update_sections(slide_ids)
+
+    def save(self, output_path):
+        """Write the package to output_path in a single streaming pass.
+
+        Returns:
+            int: Number of parts dropped because nothing refers to them anymore
+        """
+        reachable = self._reachable_parts()
+        dropped = {
+            name
+            for name in self._names | set(self._copies)
+            if name not in reachable and not _is_rels_part(name)
+        }
+        for name in dropped:
+            self._remove_override(name)
+
+        rewritten = {
+            PRESENTATION_PART: self._presentation,
+            CONTENT_TYPES_PART: self._content_types,
+        }
+        for name, rels in self._rels.items():
+            if name not in dropped:
+                rewritten[_rels_name(name)] = rels
+
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            # Members in their original order, then the copies
+            for info in self._zip.infolist():
+                name = info.filename
+                if name in rewritten:
+                    self._write_xml(zf, name, rewritten.pop(name))
+                elif name in dropped or (
+                    _is_rels_part(name) and _rels_source(name) in dropped
+                ):
+                    continue
+                else:
+                    _copy_member(zf, self._zip, info, name)
+
+            for name, source in self._copies.items():
+                if name not in dropped:
+                    _copy_member(zf, self._zip, self._zip.getinfo(source), name)
+            for name, root in rewritten.items():
+                self._write_xml(zf, name, root)
+
+        return len(dropped & self._names)
+
+    def _copy_part(self, name, copies):
+        """Copy a part and the parts it owns, returning the name of the copy.
+
+        copies maps the parts already copied for the same slide to their copy,
+        so parts referenced twice are copied once.
+        """
+        if name in copies:
+            return copies[name]
+        new_name = self._new_part_name(name)
+        copies[name] = new_name
+        self._copies[new_name] = name
+
+        content_type = self._override(name)
+        if content_type is not None:
+            override = lxml.etree.SubElement(
+                self._content_types, f"{{{CT_NS}}}Override"
             )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
+            override.set("PartName", "/" + new_name)
+            override.set("ContentType", content_type)
+
+        rels = deepcopy(self._read_relationships(name))
+        for rel in list(rels):
+            rel_type = rel.get("Type", "")
+            if rel.get("TargetMode") == "External" or rel_type.endswith(
+                SHARED_RELATIONSHIPS
+            ):
+                continue
+            if rel_type.endswith(DROPPED_RELATIONSHIPS):
+                rels.remove(rel)
+                continue
+            target = self._target(name, rel)
+            if target in self._names:
+                target_copy = self._copy_part(target, copies)
+                rel.set(
+                    "Target",
+                    posixpath.relpath(target_copy, posixpath.dirname(new_name)),
                 )
+        if len(rels) or _rels_name(name) in self._names:
+            self._rels[new_name] = rels
+        return new_name
+
+    def _new_part_name(self, name):
+        """Return an unused part name numbered like name (slide3.xml -> slide41.xml)."""
+        directory, filename = posixpath.split(name)
+        match = re.match(r"^(.*?)(\d*)((?:\.[^.]*)?)$", filename)
+        stem, extension = match.group(1), match.group(3)
+        pattern = re.compile(rf"^{re.escape(stem)}(\d+){re.escape(extension)}$")
+        used = [
+            int(found.group(1))
+            for existing in self._names | set(self._copies)
+            if posixpath.dirname(existing) == directory
+            and (found := pattern.match(posixpath.basename(existing)))
+        ]
+        return posixpath.join(directory, f"{stem}{max(used, default=0) + 1}{extension}")
+
+    def _read_relationships(self, name):
+        """Return the Relationships element of a part, edited or as stored.
+
+        Parts without relationships get an empty element, which is not kept.
+        """
+        if name in self._rels:
+            return self._rels[name]
+        rels_name = _rels_name(name)
+        if rels_name in self._names:
+            return self._read_xml(rels_name)
+        return lxml.etree.Element(f"{{{RELS_NS}}}Relationships", nsmap={None: RELS_NS})
+
+    def _relationships(self, name):
+        """Return the Relationships element of a part for editing."""
+        if name not in self._rels:
+            self._rels[name] = self._read_relationships(name)
+        return self._rels[name]
+
+    def _add_relationship(self, name, rel_type, target):
+        """Add a relationship from part name to target and return its rId."""
+        rels = self._relationships(name)
+        numbers = [
+            int(rel.get("Id")[3:])
+            for rel in rels
+            if re.fullmatch(r"rId\d+", rel.get("Id", ""))
+        ]
+        rid = f"rId{max(numbers, default=0) + 1}"
+        rel = lxml.etree.SubElement(rels, f"{{{RELS_NS}}}Relationship")
+        rel.set("Id", rid)
+        rel.set("Type", rel_type)
+        rel.set("Target", posixpath.relpath(target, posixpath.dirname(name)))
+        return rid
+
+    def _target(self, name, rel):
+        """Resolve the part name a relationship of part name points to."""
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            return target.lstrip("/")
+        return posixpath.normpath(posixpath.join(posixpath.dirname(name), target))
+
+    def _reachable_parts(self):
+        """Return the parts reachable from the package relationships."""
+        reachable = set()
+        pending = [""]  # The package itself, whose relationships are _rels/.rels
+        while pending:
+            name = pending.pop()
+            if name and name not in self._names and name not in self._copies:
+                continue  # Missing target
+            for rel in self._read_relationships(name):
+                if rel.get("TargetMode") == "External":
+                    continue
+                target = self._target(name, rel)
+                if target not in reachable:
+                    reachable.add(target)
+                    pending.append(target)
+        return reachable | {CONTENT_TYPES_PART}
+
+    def _override(self, name):
+        """Return the content type overridden for a part, or None."""
+        for override in self._content_types.iter(f"{{{CT_NS}}}Override"):
+            if override.get("PartName") == "/" + name:
+                return override.get("ContentType")
+        return None
+
+    def _remove_override(self, name):
+        """Remove the content type override of a dropped part."""
+        for override in self._content_types.iter(f"{{{CT_NS}}}Override"):
+            if override.get("PartName") == "/" + name:
+                self._content_types.remove(override)
+                return
+
+    def _section_list(self):
+        """Return the p14:sectionLst element of the presentation, or None."""
+        return self._presentation.find(
+            f"{{{P_NS}}}extLst/{{{P_NS}}}ext/{{{P14_NS}}}sectionLst"
+        )
 
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
+    def _slide_sections(self):
+        """Map slide ids to the p14:section listing them."""
+        sections = {}
+        section_list = self._section_list()
+        if section_list is not None:
+            for section in section_list.iter(f"{{{P14_NS}}}section"):
+                for slide_id in section.iter(f"{{{P14_NS}}}sldId"):
+                    sections[slide_id.get("id")] = section
+        return sections
+
+    def _update_sections(self, slide_ids):
+        """Rebuild the sections so that they follow the new slide order.
+
+        Consecutive slides from the same section stay in one section; a section
+        whose slides are now separated is split into sections of the same name.
+        Sections left without slides are kept, empty, after the others.
+        """
+        section_list = self._section_list()
+        if section_list is None:
+            return
+        original = list(section_list)
+        for section in original:
+            section_list.remove(section)
+
+        used = set()
+        current = None
+        current_source = None
+        for slide_id in slide_ids:
+            source = self._sections.get(slide_id.get("id"))
+            if source is None:
+                source = current_source if current_source is not None else original[0]
+            if current is None or source is not current_source:
+                current = deepcopy(source)
+                slide_list = current.find(f"{{{P14_NS}}}sldIdLst")
+                if slide_list is None:
+                    slide_list = lxml.etree.SubElement(
+                        current, f"{{{P14_NS}}}sldIdLst"
+                    )
+                slide_list.clear()
+                if source in used:
+                    current.set("id", "{" + str(uuid.uuid4()).upper() + "}")
+                used.add(source)
+                current_source = source
+                section_list.append(current)
+            entry = lxml.etree.SubElement(
+                current.find(f"{{{P14_NS}}}sldIdLst"), f"{{{P14_NS}}}sldId"
+            )
+            entry.set("id", slide_id.get("id"))
+
+        for section in original:
+            if section not in used:
+                slide_list = section.find(f"{{{P14_NS}}}sldIdLst")
+                if slide_list is not None:
+                    slide_list.clear()
+                section_list.append(section)
+
+    def _read_xml(self, name):
+        return lxml.etree.fromstring(self._zip.read(name))
+
+    def _write_xml(self, zf, name, root):
+        zf.writestr(
+            name,
+            lxml.etree.tostring(
+                root, xml_declaration=True, encoding="UTF-8", standalone=True
+            ),
+        )
 
-    return new_slide
 
+def _rels_name(name):
+    """Return the relationships part of a part ("" is the package itself)."""
+    directory, filename = posixpath.split(name)
+    return posixpath.join(directory, "_rels", f"{filename}.rels")
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
 
+def _is_rels_part(name):
+    return name.endswith(".rels") and posixpath.basename(
+        posixpath.dirname(name)
+    ) == "_rels"
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
+def _rels_source(rels_name):
+    """Return the part a relationships part belongs to."""
+    directory = posixpath.dirname(posixpath.dirname(rels_name))
+    return posixpath.join(directory, posixpath.basename(rels_name)[: -len(".rels")])
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+
+def _copy_member(zf, source, info, arcname):
+    """Copy a member from source into zf under arcname, without recompressing it.
+
+    Members copy_raw_member cannot copy are recompressed instead.
+    """
+    if not can_copy_raw(info):
+        with source.open(info) as data:
+            zf.writestr(arcname, data.read(), compress_type=info.compress_type)
+        return
+    zinfo = zipfile.ZipInfo(arcname, info.date_time)
+    zinfo.external_attr = info.external_attr
+    copy_raw_member(zf, source, info, zinfo)
 
 
 def rearrange_presentation(template_path, output_path, slide_sequence):
     """
     Create a new presentation with slides from template in specified order.
 
+    Works on the package directly: the first use of a template slide keeps
+    the slide, every further use adds a copy sharing its layout and media,
+    unused slides and every part only they referred to are dropped, and the
+    result is written in one pass.
+
     Args:
         template_path: Path to template PPTX file
         output_path: Path for output PPTX file
         slide_sequence: List of slide indices (0-based) to include
     """
-    # Copy template to preserve dimensions and theme
-    if template_path != output_path:
-        shutil.copy2(template_path, output_path)
-        prs = Presentation(output_path)
-    else:
-        prs = Presentation(template_path)
-
-    total_slides = len(prs.slides)
-
-    # Validate indices
-    for idx in slide_sequence:
-        if idx < 0 or idx >= total_slides:
-            raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
-
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
-
-    # Step 1: DUPLICATE repeated slides
-    print(f"Processing {len(slide_sequence)} slides from template...")
-    for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
-            # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
-            print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
-            # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
-            print(
-                f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
-            )
-            for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
-            duplicated[template_idx] = duplicates
-        else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
-            print(f"  [{i}] Using original slide {template_idx}")
-
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
-
-    # Save the presentation
-    prs.save(output_path)
+    package = SlidePackage(template_path)
+    try:
+        slide_ids = package.slide_ids
+        total_slides = len(slide_ids)
+
+        # Validate indices
+        for idx in slide_sequence:
+            if idx < 0 or idx >= total_slides:
+                raise ValueError(
+                    f"Slide index {idx} out of range (0-{total_slides - 1})"
+                )
+
+        # Step 1: DUPLICATE repeated slides
+        print(f"Processing {len(slide_sequence)} slides from template...")
+        used = set()
+        final_ids = []
+        for i, template_idx in enumerate(slide_sequence):
+            if template_idx in used:
+                final_ids.append(package.duplicate_slide(slide_ids[template_idx]))
+                print(f"  [{i}] Using duplicate of slide {template_idx}")
+            else:
+                used.add(template_idx)
+                final_ids.append(slide_ids[template_idx])
+                print(f"  [{i}] Using original slide {template_idx}")
+
+        # Step 2: DELETE unwanted slides and REORDER to final sequence
+        print(f"\nDeleting {total_slides - len(used)} unused slides...")
+        print(f"Reordering {len(final_ids)} slides to final sequence...")
+        package.set_slides(final_ids)
+
+        # Write to a temporary file first, so the template may be the output
+        output_path = Path(output_path)
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        try:
+            dropped = package.save(temp_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+    finally:
+        package.close()
+    temp_path.replace(output_path)
+
+    print(f"Removed {dropped} parts no slide refers to anymore")
     print(f"\nSaved rearranged presentation to: {output_path}")
-    print(f"Final presentation has {len(prs.slides)} slides")
+    print(f"Final presentation has {len(final_ids)} slides")
 
 
 if __name__ == "__main__":
@@ -19,7 +19,8 @@ Grid limits by column count:
 - 6 cols: max 42 slides per grid (6×7)
 
 Usage:
-    python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+    python thumbnail.py input.pptx [output_prefix] [--cols N] [--slides RANGES]
+        [--cache-dir DIR [--cache-size MB]] [--workers N] [--outline-placeholders]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,24 +39,60 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py large-deck.pptx preview --slides 0-4,12
+    # Renders only slides 0 to 4 and 12 into preview.jpg
+
+    python thumbnail.py deck.pptx workspace/grid --cache-dir workspace/.thumbnails
+    # Renders only slides that changed since the previous run with this cache
 """
 
 import argparse
+import collections
+import hashlib
+import itertools
+import json
+import os
+import posixpath
 import subprocess
 import sys
 import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Shared with the ooxml scripts (LibreOffice pool)
+sys.path.append(str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+
+import lxml.etree
 from inventory import extract_text_inventory
+from office_pool import convert_document
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
-CONVERSION_DPI = 100  # DPI for PDF to image conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
+CACHE_SIZE_MB = 200  # Default size bound of the thumbnail cache
+
+# Namespaces of the package parts read for cache keys
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Relationships to parts that do not change how a slide is rendered
+UNRENDERED_RELATIONSHIPS = (
+    "/slide",
+    "/notesSlide",
+    "/notesMaster",
+    "/handoutMaster",
+    "/comments",
+    "/commentAuthors",
+    "/presProps",
+    "/viewProps",
+)
 
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
@@ -81,6 +118,26 @@ def main():
         default=DEFAULT_COLS,
         help=f"Number of columns (default: {DEFAULT_COLS}, max: {MAX_COLS})",
     )
+    parser.add_argument(
+        "--slides",
+        help="Slides to include, numbered from 0 (e.g. 0-4,7,10-; default: all)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse thumbnails of unchanged slides from this directory across runs",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=CACHE_SIZE_MB,
+        help=f"Size bound of the thumbnail cache in MB (default: {CACHE_SIZE_MB})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes composing grids (0 = one per CPU)",
+    )
     parser.add_argument(
         "--outline-placeholders",
         action="store_true",
@@ -118,23 +175,36 @@ def main():
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
-            # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
-            if not slide_images:
+            # Render slides to images, consumed by the grids as they are produced
+            cache = None
+            if args.cache_dir:
+                cache = ThumbnailCache(args.cache_dir, args.cache_size * 1024 * 1024)
+                slide_count, slide_images = render_cached_slides(
+                    input_path, Path(temp_dir), THUMBNAIL_WIDTH, cache, args.slides
+                )
+            else:
+                slide_count, slide_images = render_slides(
+                    input_path, Path(temp_dir), THUMBNAIL_WIDTH, args.slides
+                )
+            if not slide_count:
                 print("Error: No slides found")
                 sys.exit(1)
 
-            print(f"Found {len(slide_images)} slides")
+            print(f"Found {slide_count} slides")
 
             # Create grids (max cols×(cols+1) images per grid)
             grid_files = create_grids(
                 slide_images,
+                slide_count,
                 cols,
                 THUMBNAIL_WIDTH,
                 output_path,
                 placeholder_regions,
                 slide_dimensions,
+                workers=args.workers,
             )
+            if cache is not None:
+                cache.prune()
 
             # Print saved files
             print(f"Created {len(grid_files)} grid(s):")
@@ -194,8 +264,53 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def parse_slide_selection(selection, total_slides):
+    """Parse a slide selection such as "0-4,7,10-" into slide indices.
+
+    Slides are numbered from 0 like in the grid labels; open ranges run to
+    the first or last slide.
+
+    Returns:
+        list: Sorted, unique slide indices
+
+    Raises:
+        ValueError: If the selection is malformed or selects no slide
+    """
+    slides = set()
+    for part in selection.split(","):
+        part = part.strip()
+        try:
+            if "-" in part:
+                first, _, last = part.partition("-")
+                first = int(first) if first.strip() else 0
+                last = int(last) if last.strip() else total_slides - 1
+            else:
+                first = last = int(part)
+        except ValueError:
+            raise ValueError(f"Invalid slide selection: {selection!r}")
+        slides.update(range(max(first, 0), min(last, total_slides - 1) + 1))
+    if not slides:
+        raise ValueError(f"No slides selected by {selection!r}")
+    return sorted(slides)
+
+
+def render_slides(pptx_path, temp_dir, width, selection=None):
+    """Render slides straight to thumbnails, handling hidden slides.
+
+    Only the selected slides are exported to PDF, and its pages are
+    rasterized at the thumbnail width and streamed from pdftoppm one by one,
+    without writing intermediate image files.
+
+    Args:
+        pptx_path: Path to the presentation
+        temp_dir: Directory for the intermediate PDF
+        width: Width of the rendered images in pixels
+        selection: Slides to render, see parse_slide_selection (default:
+            None, all slides)
+
+    Returns:
+        tuple: (number of slides, iterator of (slide index, image) in order)
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
@@ -212,131 +327,511 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
+    if selection:
+        slides = parse_slide_selection(selection, total_slides)
+    else:
+        slides = list(range(total_slides))
+    visible = [idx for idx in slides if idx + 1 not in hidden_slides]
+
+    slide_width = prs.slide_width or 9144000
+    slide_height = prs.slide_height or 5143500
+    placeholder_size = (width, round(width * slide_height / slide_width))
+
+    def images():
+        pages = iter(())
+        process = None
+        if visible:
+            subset = len(slides) < total_slides
+            pdf_path = _export_pdf(pptx_path, temp_dir, visible, subset)
+            print(f"Rendering {len(visible)} slide(s) at {width}px...")
+            process = subprocess.Popen(
+                [
+                    "pdftoppm",
+                    "-scale-to-x",
+                    str(width),
+                    "-scale-to-y",
+                    "-1",
+                    str(pdf_path),
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            pages = _read_ppm_stream(process.stdout)
+        try:
+            for idx in slides:
+                if idx + 1 in hidden_slides:
+                    # Create placeholder image for hidden slide
+                    yield idx, create_hidden_slide_placeholder(placeholder_size)
+                else:
+                    page = next(pages, None)
+                    if page is None:
+                        raise RuntimeError("Image conversion failed")
+                    yield idx, page
+            # More pages than slides means the slide selection was not applied
+            # and the pages shown so far belong to other slides
+            if next(pages, None) is not None:
+                raise RuntimeError("Image conversion produced more pages than slides")
+        finally:
+            if process is not None:
+                process.stdout.close()
+                if process.poll() is None:
+                    process.kill()
+                process.wait()
+
+    return len(slides), images()
+
+
+def render_cached_slides(pptx_path, temp_dir, width, cache, selection=None):
+    """Like render_slides, but reuse thumbnails of unchanged slides from cache.
+
+    Only the selected slides missing from the cache are rendered (in a
+    single conversion). Cached slides are produced as tile paths, decoded
+    when their grid is composed (see load_tile); prune the cache only once
+    the grids are done.
+
+    Returns:
+        tuple: (number of slides, iterator of (slide index, image or tile
+            path) in order)
+    """
+    digests, slide_size = slide_digests(pptx_path)
+    if selection:
+        slides = parse_slide_selection(selection, len(digests))
+    else:
+        slides = list(range(len(digests)))
+    keys = {
+        idx: cache.key(digests[idx], width)
+        for idx in slides
+        if digests[idx] is not None  # Hidden slides are not rendered
+    }
+    misses = [idx for idx in keys if not cache.contains(keys[idx])]
+    missing = set(misses)
+    print(f"Thumbnail cache: {len(keys) - len(misses)} of {len(keys)} slides cached")
+
+    placeholder_size = (width, round(width * slide_size[1] / slide_size[0]))
+
+    def images():
+        rendered = iter(())
+        if misses:
+            selection = ",".join(str(idx) for idx in misses)
+            rendered = render_slides(pptx_path, temp_dir, width, selection)[1]
+        stored = []  # Keys of the thumbnails rendered and cached by this run
+        try:
+            for idx in slides:
+                if idx not in keys:
+                    yield idx, create_hidden_slide_placeholder(placeholder_size)
+                    continue
+                if idx in missing:
+                    image = next(rendered, (None, None))[1]
+                    if image is None:
+                        raise RuntimeError("Image conversion failed")
+                    cache.put(keys[idx], image)
+                    stored.append(keys[idx])
+                else:
+                    image = cache.get(keys[idx])
+                    if image is None:
+                        # Evicted by a concurrent run since the check
+                        with tempfile.TemporaryDirectory(dir=temp_dir) as slide_dir:
+                            _, images = render_slides(
+                                pptx_path, Path(slide_dir), width, str(idx)
+                            )
+                            image = next(images)[1]
+                            next(images, None)  # Checks no pages are left over
+                        cache.put(keys[idx], image)
+                yield idx, image
+            # Let render_slides check that no pages are left over
+            next(rendered, None)
+        except RuntimeError:
+            # Rendered thumbnails may belong to other slides; keep none of them
+            for key in stored:
+                cache.discard(key)
+            raise
+
+    return len(slides), images()
+
+
+def slide_digests(pptx_path):
+    """Hash each slide together with every package part that affects its rendering.
+
+    A slide digest covers the slide XML, the parts it references directly or
+    indirectly (layout, master, theme, media, charts, ...) and the
+    presentation-wide settings (slide size, default text styles, table
+    styles, embedded fonts). Slides showing a slide number also depend on
+    their position. XML parts are hashed by content, binary parts by size and
+    CRC-32 from the archive directory, so media is never decompressed.
+
+    Returns:
+        tuple: (list of hex digests in slide order, None for hidden slides,
+            (slide width, slide height) in EMU)
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        part_digests = {}
+        relationships = {}
+
+        def part_digest(name):
+            if name not in part_digests:
+                if name.endswith((".xml", ".rels")):
+                    content = zf.read(name)
+                    part_digests[name] = (
+                        hashlib.sha256(content).hexdigest(),
+                        b'type="slidenum"' in content,
+                    )
+                else:
+                    info = zf.getinfo(name)
+                    part_digests[name] = (f"{info.file_size}:{info.CRC:08x}", False)
+            return part_digests[name]
+
+        def related_parts(name):
+            """Return (rId, type, internal target) of the relationships of a part."""
+            if name not in relationships:
+                directory, filename = posixpath.split(name)
+                rels_name = posixpath.join(directory, "_rels", f"{filename}.rels")
+                relationships[name] = []
+                if rels_name in zf.NameToInfo:
+                    root = lxml.etree.fromstring(zf.read(rels_name))
+                    for rel in root.iter(f"{{{RELS_NS}}}Relationship"):
+                        target = rel.get("Target", "")
+                        if rel.get("TargetMode") != "External":
+                            target = posixpath.normpath(
+                                posixpath.join(directory, target)
+                            ).lstrip("/")
+                        relationships[name].append(
+                            (rel.get("Id"), rel.get("Type", ""), target)
+                        )
+            return relationships[name]
+
+        def closure_digest(digest, root_name, skip_root_types=()):
+            """Hash root_name and all parts it references; return slide number use."""
+            uses_slide_number = False
+            seen = {root_name}
+            pending = [root_name]
+            while pending:
+                name = pending.pop(0)
+                if name != root_name:
+                    content_digest, numbered = part_digest(name)
+                    digest.update(f"{name}\0{content_digest}\0".encode())
+                    uses_slide_number |= numbered
+                for _, rel_type, target in related_parts(name):
+                    if rel_type.endswith(UNRENDERED_RELATIONSHIPS):
+                        continue
+                    if target not in zf.NameToInfo:
+                        # External or missing target: its reference is hashed
+                        digest.update(f"{name}\0{rel_type}\0{target}\0".encode())
+                    elif target not in seen:
+                        seen.add(target)
+                        pending.append(target)
+            return uses_slide_number
+
+        # Presentation-wide settings, without the slide list
+        presentation = lxml.etree.fromstring(zf.read("ppt/presentation.xml"))
+        slide_ids = presentation.find(f"{{{P_NS}}}sldIdLst")
+        slide_rids = []
+        if slide_ids is not None:
+            slide_rids = [sld_id.get(f"{{{R_NS}}}id") for sld_id in slide_ids]
+            presentation.remove(slide_ids)
+        presentation_digest = hashlib.sha256(lxml.etree.tostring(presentation))
+        closure_digest(presentation_digest, "ppt/presentation.xml")
+
+        slide_size = presentation.find(f"{{{P_NS}}}sldSz")
+        if slide_size is not None:
+            size = (int(slide_size.get("cx")), int(slide_size.get("cy")))
+        else:
+            size = (9144000, 5143500)
+
+        targets = {
+            rid: target for rid, _, target in related_parts("ppt/presentation.xml")
+        }
+        digests = []
+        for position, rid in enumerate(slide_rids):
+            slide_name = targets[rid]
+            slide = lxml.etree.fromstring(zf.read(slide_name))
+            if slide.get("show") == "0":
+                digests.append(None)
+                continue
+            digest = presentation_digest.copy()
+            digest.update(part_digest(slide_name)[0].encode())
+            uses_slide_number = part_digest(slide_name)[1]
+            uses_slide_number |= closure_digest(digest, slide_name)
+            if uses_slide_number:
+                digest.update(f"slide number {position}".encode())
+            digests.append(digest.hexdigest())
+
+    return digests, size
+
+
+class ThumbnailCache:
+    """Size-bounded on-disk cache of slide thumbnails.
+
+    Thumbnails are keyed by slide_digests and the thumbnail width, so a slide
+    is only rendered again once it, or a part it depends on, changed. Least
+    recently used thumbnails are evicted once the cache exceeds max_bytes;
+    file modification times record the last use.
+    """
 
-    # Convert to PDF
+    # Bump when rendering changes, so that thumbnails of older code are not reused.
+    CACHE_VERSION = "1"
+
+    def __init__(self, cache_dir, max_bytes=CACHE_SIZE_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def key(self, slide_digest, width):
+        """Return the cache key of a slide digest rendered at width pixels."""
+        return hashlib.sha256(
+            f"{self.CACHE_VERSION}\0{width}\0{slide_digest}".encode()
+        ).hexdigest()
+
+    def contains(self, key):
+        """Check whether a thumbnail is cached for key."""
+        return self._tile_file(key).exists()
+
+    def get(self, key):
+        """Return the cached thumbnail file for key, or None, marking it as used."""
+        tile_file = self._tile_file(key)
+        try:
+            os.utime(tile_file)
+        except OSError:
+            return None
+        return tile_file
+
+    def put(self, key, image):
+        """Store a thumbnail under key."""
+        tile_file = self._tile_file(key)
+        try:
+            tile_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = tile_file.with_suffix(f".{os.getpid()}.tmp")
+            image.save(temp_file, "JPEG", quality=JPEG_QUALITY)
+            temp_file.replace(tile_file)
+        except OSError:
+            pass  # The cache is an optimization only
+
+    def discard(self, key):
+        """Remove the thumbnail stored under key, if any."""
+        try:
+            self._tile_file(key).unlink()
+        except OSError:
+            pass
+
+    def prune(self):
+        """Evict least recently used thumbnails until the cache fits max_bytes."""
+        tiles = []
+        total = 0
+        for tile_file in self.cache_dir.glob("*/*.jpg"):
+            try:
+                stat = tile_file.stat()
+            except OSError:
+                continue
+            tiles.append((stat.st_mtime_ns, stat.st_size, tile_file))
+            total += stat.st_size
+        tiles.sort()
+        for _, size, tile_file in tiles:
+            if total <= self.max_bytes:
+                break
+            try:
+                tile_file.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def _tile_file(self, key):
+        """Return the thumbnail file path for a key."""
+        return self.cache_dir / key[:2] / f"{key}.jpg"
+
+
+def _export_pdf(pptx_path, temp_dir, visible, subset):
+    """Convert the presentation to PDF with one page per visible slide to render.
+
+    When only a subset is rendered, only those slides are exported. Hidden
+    slides are then exported too, so that the page range counts every
+    slide; none of them is selected.
+    """
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
+    convert_to = "pdf:impress_pdf_Export"
+    if subset:
+        options = {
+            "PageRange": {
+                "type": "string",
+                "value": ",".join(str(idx + 1) for idx in visible),
+            },
+            "ExportHiddenSlides": {"type": "boolean", "value": "true"},
+        }
+        convert_to += ":" + json.dumps(options)
+    try:
+        return convert_document(pptx_path, temp_dir, convert_to)
+    except RuntimeError:
         raise RuntimeError("PDF conversion failed")
 
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
-
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
 
-    # Create full list with placeholders for hidden slides
-    all_images = []
-    visible_idx = 0
-
-    # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
-
-    for slide_num in range(1, total_slides + 1):
-        if slide_num in hidden_slides:
-            # Create placeholder image for hidden slide
-            placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
-            placeholder_img = create_hidden_slide_placeholder(placeholder_size)
-            placeholder_img.save(placeholder_path, "JPEG")
-            all_images.append(placeholder_path)
+def _read_ppm_stream(stream):
+    """Yield the images of a stream of concatenated binary PPM files."""
+    while True:
+        header = []
+        while len(header) < 4:
+            token = _read_ppm_token(stream)
+            if token is None:
+                if header:
+                    raise RuntimeError("Image conversion failed")
+                return
+            header.append(token)
+        magic, width, height, maxval = header
+        if magic != b"P6" or maxval != b"255":
+            raise RuntimeError("Image conversion failed")
+        size = (int(width), int(height))
+        data = stream.read(size[0] * size[1] * 3)
+        if len(data) != size[0] * size[1] * 3:
+            raise RuntimeError("Image conversion failed")
+        yield Image.frombytes("RGB", size, data)
+
+
+def _read_ppm_token(stream):
+    """Read one whitespace-delimited PPM header token, or None at the end.
+
+    Consumes exactly one whitespace byte after the token, so that after the
+    maxval token the stream is positioned at the pixel data.
+    """
+    token = b""
+    while True:
+        char = stream.read(1)
+        if not char:
+            return token or None
+        if char.isspace():
+            if token:
+                return token
+        elif char == b"#" and not token:
+            # Comment up to the end of the line
+            while stream.read(1) not in (b"\n", b""):
+                pass
         else:
-            # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
-
-    return all_images
+            token += char
 
 
 def create_grids(
-    image_paths,
+    slide_images,
+    slide_count,
     cols,
     width,
     output_path,
     placeholder_regions=None,
     slide_dimensions=None,
+    workers=1,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    slide_images is an iterable of (slide index, image) pairs of slide_count
+    slides, where an image is a PIL image or the path of a JPEG tile; each
+    grid is composed as soon as its images have been produced. With several
+    workers, grids are composed in parallel processes, and at most workers
+    grids are pulled from slide_images ahead of the finished ones, which
+    bounds memory.
+    """
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
-    grid_files = []
+    grid_count = (slide_count + max_images_per_grid - 1) // max_images_per_grid
+    workers = workers if workers else (os.cpu_count() or 1)
+    workers = min(workers, grid_count)
 
     print(
         f"Creating grids with {cols} columns (max {max_images_per_grid} images per grid)"
     )
 
-    # Split images into chunks
-    for chunk_idx, start_idx in enumerate(
-        range(0, len(image_paths), max_images_per_grid)
-    ):
-        end_idx = min(start_idx + max_images_per_grid, len(image_paths))
-        chunk_images = image_paths[start_idx:end_idx]
+    def grid_jobs():
+        """Yield the arguments of save_grid for each chunk of images."""
+        images = iter(slide_images)
+        for chunk_idx in range(grid_count):
+            chunk_images = list(itertools.islice(images, max_images_per_grid))
+
+            # Only the outlines of this chunk's slides are sent to a worker
+            regions = None
+            if placeholder_regions:
+                regions = {
+                    slide_idx: placeholder_regions[slide_idx]
+                    for slide_idx, _ in chunk_images
+                    if slide_idx in placeholder_regions
+                }
 
-        # Create grid for this chunk
-        grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
-        )
+            # Generate output filename
+            if slide_count <= max_images_per_grid:
+                # Single grid - use base filename without suffix
+                grid_filename = output_path
+            else:
+                # Multiple grids - insert index before extension with dash
+                stem = output_path.stem
+                suffix = output_path.suffix
+                grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
 
-        # Generate output filename
-        if len(image_paths) <= max_images_per_grid:
-            # Single grid - use base filename without suffix
-            grid_filename = output_path
-        else:
-            # Multiple grids - insert index before extension with dash
-            stem = output_path.stem
-            suffix = output_path.suffix
-            grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+            yield chunk_images, cols, width, regions, slide_dimensions, grid_filename
 
-        # Save grid
-        grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
-        grid_files.append(str(grid_filename))
+    if workers <= 1:
+        return [save_grid(*job) for job in grid_jobs()]
 
+    grid_files = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for job in grid_jobs():
+            if len(pending) >= workers:
+                grid_files.append(pending.popleft().result())
+            pending.append(executor.submit(save_grid, *job))
+        grid_files.extend(future.result() for future in pending)
     return grid_files
 
 
+def save_grid(
+    slide_images,
+    cols,
+    width,
+    placeholder_regions,
+    slide_dimensions,
+    grid_filename,
+):
+    """Create one thumbnail grid and save it, returning its file name."""
+    slide_images = [
+        (slide_idx, load_tile(image, width)) for slide_idx, image in slide_images
+    ]
+    grid = create_grid(
+        slide_images, cols, width, placeholder_regions, slide_dimensions
+    )
+
+    # Save grid
+    grid_filename.parent.mkdir(parents=True, exist_ok=True)
+    grid.save(str(grid_filename), quality=JPEG_QUALITY)
+    return str(grid_filename)
+
+
+def load_tile(image, width):
+    """Return a slide image, decoding JPEG files at reduced size.
+
+    JPEG files are decoded in draft mode, scaled by the decoder to the
+    smallest power-of-two fraction that is still at least width pixels wide,
+    instead of being decoded at full size and downscaled afterwards.
+    """
+    if isinstance(image, Image.Image):
+        return image
+    with Image.open(image) as img:
+        img.draft("RGB", (width, max(1, width * img.height // img.width)))
+        img.load()
+        return img.convert("RGB") if img.mode != "RGB" else img
+
+
 def create_grid(
-    image_paths,
+    slide_images,
     cols,
     width,
-    start_slide_num=0,
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from slide images with optional placeholder outlining.
+
+    slide_images is a list of (slide index, image) pairs.
+    """
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
     # Get dimensions
-    with Image.open(image_paths[0]) as img:
-        aspect = img.height / img.width
+    first_img = slide_images[0][1]
+    aspect = first_img.height / first_img.width
     height = int(width * aspect)
 
     # Calculate grid size
-    rows = (len(image_paths) + cols - 1) // cols
+    rows = (len(slide_images) + cols - 1) // cols
     grid_w = cols * width + (cols + 1) * GRID_PADDING
     grid_h = rows * (height + font_size + label_padding * 2) + (rows + 1) * GRID_PADDING
 
@@ -353,7 +848,7 @@ def create_grid(
         font = ImageFont.load_default()
 
     # Place thumbnails
-    for i, img_path in enumerate(image_paths):
+    for i, (slide_idx, img) in enumerate(slide_images):
         row, col = i // cols, i % cols
         x = col * width + (col + 1) * GRID_PADDING
         y_base = (
@@ -361,7 +856,7 @@ def create_grid(
         )
 
         # Add label with actual slide number
-        label = f"{start_slide_num + i}"
+        label = f"{slide_idx}"
         bbox = draw.textbbox((0, 0), label, font=font)
         text_w = bbox[2] - bbox[0]
         draw.text(
@@ -374,75 +869,69 @@ def create_grid(
         # Add thumbnail below label with proportional spacing
         y_thumbnail = y_base + label_padding + font_size + label_padding
 
-        with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
-
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
-
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
-
-            # Add border
-            if BORDER_WIDTH > 0:
-                draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
+        # Get rendered dimensions before thumbnail
+        orig_w, orig_h = img.size
+
+        # Apply placeholder outlines if enabled
+        if placeholder_regions and slide_idx in placeholder_regions:
+            # Convert to RGBA for transparency support
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
+
+            # Get the regions for this slide
+            regions = placeholder_regions[slide_idx]
+
+            # Calculate scale factors using actual slide dimensions
+            slide_width_inches, slide_height_inches = slide_dimensions
+
+            x_scale = orig_w / slide_width_inches
+            y_scale = orig_h / slide_height_inches
+
+            # Create a highlight overlay
+            overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
+            overlay_draw = ImageDraw.Draw(overlay)
+
+            # Highlight each placeholder region
+            for region in regions:
+                # Convert from inches to pixels in the rendered image
+                px_left = int(region["left"] * x_scale)
+                px_top = int(region["top"] * y_scale)
+                px_width = int(region["width"] * x_scale)
+                px_height = int(region["height"] * y_scale)
+
+                # Draw highlight outline with red color and thick stroke
+                # Using a bright red outline instead of fill
+                stroke_width = max(
+                    2, min(orig_w, orig_h) // 100
+                )  # Thicker proportional stroke width
+                overlay_draw.rectangle(
+                    [(px_left, px_top), (px_left + px_width, px_top + px_height)],
+                    outline=(255, 0, 0, 255),  # Bright red, fully opaque
+                    width=stroke_width,
                 )
 
+            # Composite the overlay onto the image using alpha blending
+            img = Image.alpha_composite(img, overlay)
+            # Convert back to RGB for JPEG saving
+            img = img.convert("RGB")
+
+        img.thumbnail((width, height), Image.Resampling.LANCZOS)
+        w, h = img.size
+        tx = x + (width - w) // 2
+        ty = y_thumbnail + (height - h) // 2
+        grid.paste(img, (tx, ty))
+
+        # Add border
+        if BORDER_WIDTH > 0:
+            draw.rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
+
     return grid
 
 
@@ -0,0 +1,574 @@
+"""
+Pool of warm headless LibreOffice instances for document conversions.
+
+Starting soffice takes seconds, far longer than converting or recalculating a
+typical document. The pool keeps up to POOL_SIZE instances running, each with
+its own user profile and listening on its own named UNO pipe, and hands jobs
+to idle instances through a queue. Instances are health-checked before every
+job and restarted after MAX_JOBS_PER_INSTANCE jobs, after a failed job or
+when they died.
+
+Instances outlive the process that started them: their profiles and state
+live in POOL_DIR, so the next process (e.g. the next pack.py or thumbnail.py
+run) connects to the running instances instead of starting its own. A lock
+file per instance serializes jobs across processes, and a small watchdog
+process shuts an instance down once it was idle for IDLE_TIMEOUT seconds.
+
+The pool talks to LibreOffice through its Python bindings (the ``uno``
+module, e.g. the python3-uno package). Where they are not importable,
+convert_document falls back to one ``soffice --convert-to`` process per call.
+
+Example usage:
+    from office_pool import convert_document, get_pool
+
+    pdf = convert_document("deck.pptx", "out", "pdf:impress_pdf_Export")
+    get_pool().map(recalculate_document, ["a.xlsx", "b.xlsx"])
+"""
+
+import hashlib
+import json
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import uno
+except ImportError:
+    uno = None
+
+# Directory holding the instances' user profiles and state across processes
+POOL_DIR = Path(
+    os.environ.get("OFFICE_POOL_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "office-pool"
+)
+
+# Number of LibreOffice instances kept running by the shared pool
+POOL_SIZE = max(1, min(4, os.cpu_count() or 1))
+
+# Jobs an instance runs before it is restarted, bounding leaked memory
+MAX_JOBS_PER_INSTANCE = 50
+
+# Seconds an instance may take to start accepting UNO connections
+STARTUP_TIMEOUT = 60
+
+# Seconds between connection attempts while an instance starts
+CONNECT_INTERVAL = 0.25
+
+# Seconds an instance may sit idle before its watchdog shuts it down
+IDLE_TIMEOUT = 600
+
+# Seconds between the watchdog's idle checks
+WATCH_INTERVAL = 15
+
+SOFFICE_ARGS = (
+    "--headless",
+    "--invisible",
+    "--nologo",
+    "--nodefault",
+    "--norestore",
+    "--nolockcheck",
+)
+
+
+def pool_available():
+    """Return True if conversions can run on warm LibreOffice instances."""
+    return (
+        uno is not None and fcntl is not None and shutil.which("soffice") is not None
+    )
+
+
+def convert_document(input_path, output_dir, convert_to, timeout=None):
+    """Convert a document like ``soffice --convert-to convert_to``.
+
+    Runs on the shared pool when available, otherwise in a new soffice
+    process.
+
+    Args:
+        input_path: Path to the document to convert
+        output_dir: Directory the converted document is written to
+        convert_to: Target extension, optionally followed by ``:`` and the
+            export filter name, and by ``:`` and its options (e.g.
+            "pdf:impress_pdf_Export", as for soffice)
+        timeout: Seconds the conversion may take (default: None, no limit)
+
+    Returns:
+        Path: The converted document, named after input_path
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        TimeoutError: If the conversion took longer than timeout
+        RuntimeError: If the conversion failed
+    """
+    input_path = Path(input_path)
+    output_dir = Path(output_dir)
+    extension = convert_to.partition(":")[0]
+    output_path = output_dir / f"{input_path.stem}.{extension}"
+
+    if pool_available():
+        try:
+            get_pool().run(
+                _convert_job, input_path, output_path, convert_to, timeout=timeout
+            )
+        except TimeoutError:
+            raise TimeoutError(f"Timeout converting {input_path.name}")
+        except Exception as e:
+            raise RuntimeError(f"Conversion of {input_path.name} failed: {e}") from e
+    else:
+        try:
+            result = subprocess.run(
+                [
+                    "soffice",
+                    "--headless",
+                    "--convert-to",
+                    convert_to,
+                    "--outdir",
+                    str(output_dir),
+                    str(input_path),
+                ],
+                capture_output=True,
+                timeout=timeout,
+                text=True,
+            )
+        except subprocess.TimeoutExpired:
+            raise TimeoutError(f"Timeout converting {input_path.name}")
+        if result.returncode != 0 or not output_path.exists():
+            raise RuntimeError(
+                result.stderr.strip() or f"Conversion of {input_path.name} failed"
+            )
+
+    if not output_path.exists():
+        raise RuntimeError(f"Conversion of {input_path.name} failed")
+    return output_path
+
+
+def recalculate_document(instance, path):
+    """Pool job recalculating all formulas of a spreadsheet and saving it in place.
+
+    Args:
+        instance: OfficeInstance running the job
+        path: Path to the spreadsheet
+    """
+    document = instance.load(path)
+    try:
+        document.calculateAll()
+        document.store()
+    finally:
+        document.close(True)
+
+
+def _convert_job(instance, input_path, output_path, convert_to):
+    """Pool job behind convert_document."""
+    document = instance.load(input_path)
+    try:
+        properties = {"Overwrite": True}
+        filter_name, _, filter_options = convert_to.partition(":")[2].partition(":")
+        if filter_name:
+            properties["FilterName"] = filter_name
+        if filter_options:
+            properties["FilterOptions"] = filter_options
+        document.storeToURL(
+            uno.systemPathToFileUrl(str(Path(output_path).absolute())),
+            _properties(**properties),
+        )
+    finally:
+        document.close(True)
+
+
+def _properties(**values):
+    """Build the PropertyValue tuple UNO calls take as keyword arguments."""
+    from com.sun.star.beans import PropertyValue
+
+    return tuple(PropertyValue(Name=name, Value=value) for name, value in values.items())
+
+
+class OfficeInstance:
+    """A headless LibreOffice process listening on a named UNO pipe.
+
+    Everything about the instance lives in its slot directory: the user
+    profile, kept across restarts so that only the first start pays for
+    creating it, a lock file held while a job runs, and a state file with the
+    process id and job count, whose modification time records the last use.
+    Any process using the same slot directory shares the instance.
+    """
+
+    def __init__(self, slot_dir):
+        self.slot_dir = Path(slot_dir)
+        self.profile_dir = self.slot_dir / "profile"
+        self.state_file = self.slot_dir / "instance.json"
+        digest = hashlib.sha1(str(self.slot_dir.absolute()).encode()).hexdigest()
+        self.pipe_name = f"office-pool-{digest[:12]}"
+        self.pid = None
+        self.jobs = 0
+        self._process = None
+        self._desktop = None
+
+    @contextmanager
+    def locked(self, blocking=True):
+        """Hold the instance's lock file, excluding jobs of other processes.
+
+        Raises:
+            BlockingIOError: If blocking is False and the lock is held
+        """
+        self.slot_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.slot_dir / "lock", "a") as lock:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            fcntl.flock(lock, flags)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def connect(self, max_jobs=MAX_JOBS_PER_INSTANCE):
+        """Connect to the instance recorded in the state file, if usable.
+
+        Call with the lock held.
+
+        Returns:
+            bool: True if the instance is running, answers UNO calls and has
+                run fewer than max_jobs jobs
+        """
+        state = self._read_state()
+        if state is None:
+            return False
+        self.pid, self.jobs = state["pid"], state["jobs"]
+        if self.jobs >= max_jobs or self._exited():
+            return False
+        if self._desktop is None:
+            try:
+                self._desktop = self._resolve_desktop()
+            except Exception:
+                return False
+        return self.is_healthy()
+
+    def start(self):
+        """Start soffice and its watchdog, and wait for UNO connections.
+
+        Call with the lock held.
+
+        Raises:
+            RuntimeError: If soffice exited or did not accept connections
+                within STARTUP_TIMEOUT seconds
+        """
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        profile_url = uno.systemPathToFileUrl(str(self.profile_dir.absolute()))
+        # A new session keeps soffice running after this process exits and
+        # makes it the leader of a process group that can be killed as a whole
+        self._process = subprocess.Popen(
+            [
+                "soffice",
+                *SOFFICE_ARGS,
+                f"-env:UserInstallation={profile_url}",
+                f"--accept=pipe,name={self.pipe_name};urp;",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.pid = self._process.pid
+        self.jobs = 0
+        self._write_state()
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                str(self.slot_dir),
+                str(self.pid),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            if self._exited():
+                code = self._process.returncode
+                self.stop()
+                raise RuntimeError(f"soffice exited during startup (code {code})")
+            try:
+                self._desktop = self._resolve_desktop()
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("soffice did not start in time")
+                time.sleep(CONNECT_INTERVAL)
+
+    def is_healthy(self):
+        """Check that the process is alive and answers UNO calls."""
+        if self.pid is None or self._desktop is None or self._exited():
+            return False
+        try:
+            self._desktop.getComponents()
+        except Exception:
+            return False
+        return True
+
+    def run(self, job, *args, timeout=None):
+        """Run job(self, *args), killing soffice if it exceeds timeout.
+
+        Call with the lock held.
+
+        Raises:
+            TimeoutError: If the job took longer than timeout
+        """
+        self.jobs += 1
+        self._write_state()
+        timer = None
+        timed_out = threading.Event()
+        if timeout is not None:
+
+            def expire():
+                timed_out.set()
+                self.kill()
+
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+        try:
+            return job(self, *args)
+        except Exception:
+            if timed_out.is_set():
+                raise TimeoutError(f"Job did not finish within {timeout}s")
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            # Marks the instance as used now, restarting its idle timeout
+            if self.state_file.exists():
+                self.state_file.touch()
+
+    def load(self, path):
+        """Open a document hidden, without macros or update prompts.
+
+        Returns:
+            The UNO document component; close it with close(True)
+
+        Raises:
+            RuntimeError: If the document could not be loaded
+        """
+        url = uno.systemPathToFileUrl(str(Path(path).absolute()))
+        document = self._desktop.loadComponentFromURL(
+            url, "_blank", 0, _properties(Hidden=True, ReadOnly=False)
+        )
+        if document is None:
+            raise RuntimeError(f"Could not load {Path(path).name}")
+        return document
+
+    def stop(self):
+        """Terminate soffice, killing it if it does not exit promptly.
+
+        Call with the lock held.
+        """
+        if self.pid is not None and not self._exited():
+            try:
+                if self._desktop is not None:
+                    self._desktop.terminate()
+                else:
+                    self._signal(signal.SIGTERM)
+                self._wait(timeout=10)
+            except Exception:
+                self.kill()
+        self.state_file.unlink(missing_ok=True)
+        self.pid = None
+        self._process = None
+        self._desktop = None
+
+    def kill(self):
+        """Kill soffice and the processes it spawned."""
+        if self.pid is None or self._exited():
+            return
+        self._signal(signal.SIGKILL)
+        self._wait(timeout=10)
+
+    def _resolve_desktop(self):
+        """Connect to the instance's pipe and return its Desktop service."""
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        context = resolver.resolve(
+            f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+        )
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def _signal(self, signum):
+        """Send a signal to the instance's process group."""
+        try:
+            os.killpg(self.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _exited(self):
+        """Check whether the recorded soffice process is gone.
+
+        A process id that was reused by another program (e.g. after a
+        reboot) counts as gone, so it is never signalled.
+        """
+        if self._process is not None and self._process.pid == self.pid:
+            return self._process.poll() is not None
+        try:
+            if os.getpgid(self.pid) != self.pid:
+                return True
+        except ProcessLookupError:
+            return True
+        try:
+            cmdline = Path(f"/proc/{self.pid}/cmdline").read_bytes()
+        except OSError:
+            return False  # No procfs, trust the process group
+        return b"office" not in cmdline and b"oosplash" not in cmdline
+
+    def _wait(self, timeout):
+        """Wait for soffice to exit, killing it when timeout expires."""
+        deadline = time.monotonic() + timeout
+        while not self._exited():
+            if time.monotonic() > deadline:
+                self._signal(signal.SIGKILL)
+                deadline = float("inf")
+            time.sleep(0.1)
+
+    def _read_state(self):
+        """Return the recorded pid and job count, or None without an instance."""
+        try:
+            state = json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return None
+        # Anything but the state _write_state records counts as no instance
+        if not isinstance(state, dict) or not all(
+            isinstance(state.get(key), int) for key in ("pid", "jobs")
+        ):
+            return None
+        return state
+
+    def _write_state(self):
+        """Record the instance's pid and job count for other processes."""
+        self.state_file.write_text(json.dumps({"pid": self.pid, "jobs": self.jobs}))
+
+
+class OfficePool:
+    """Fixed-size pool of OfficeInstances fed through a queue.
+
+    Instances are connected to, or started, on first use and are left running
+    for later processes. run() blocks until an instance is idle, so any number
+    of threads may submit jobs; map() runs a batch on all instances at once.
+    """
+
+    def __init__(self, size=POOL_SIZE, max_jobs=MAX_JOBS_PER_INSTANCE, pool_dir=None):
+        if not pool_available():
+            raise RuntimeError("LibreOffice or its Python bindings are not installed")
+        self.size = size
+        self.max_jobs = max_jobs
+        self.pool_dir = Path(pool_dir or POOL_DIR)
+        self._instances = [
+            OfficeInstance(self.pool_dir / f"instance-{i}") for i in range(size)
+        ]
+        self._idle = queue.Queue()
+        for instance in self._instances:
+            self._idle.put(instance)
+
+    def run(self, job, *args, timeout=None):
+        """Run job(instance, *args) on the next idle instance.
+
+        Args:
+            job: Callable taking an OfficeInstance and args
+            timeout: Seconds the job may take, excluding startup (default:
+                None, no limit)
+
+        Returns:
+            The result of job
+        """
+        instance = self._idle.get()
+        try:
+            with instance.locked():
+                if not instance.connect(self.max_jobs):
+                    instance.stop()
+                    instance.start()
+                try:
+                    return instance.run(job, *args, timeout=timeout)
+                except Exception:
+                    # The instance may be left in any state; restart it before reuse
+                    instance.stop()
+                    raise
+        finally:
+            self._idle.put(instance)
+
+    def map(self, job, items, timeout=None):
+        """Run job(instance, item) for each item on all instances concurrently.
+
+        Returns:
+            list: Results in the order of items
+        """
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [
+                executor.submit(self.run, job, item, timeout=timeout)
+                for item in items
+            ]
+            return [future.result() for future in futures]
+
+    def close(self):
+        """Stop all instances now instead of when they become idle."""
+        for instance in self._instances:
+            with instance.locked():
+                instance.connect(max_jobs=float("inf"))
+                instance.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide OfficePool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = OfficePool()
+        return _pool
+
+
+def _watch(slot_dir, pid):
+    """Shut an instance down once it was idle for IDLE_TIMEOUT seconds.
+
+    Runs in its own process next to the soffice process pid and exits with
+    it, or when the instance in slot_dir was replaced by another one.
+    """
+    instance = OfficeInstance(slot_dir)
+    while True:
+        time.sleep(WATCH_INTERVAL)
+        try:
+            with instance.locked(blocking=False):
+                state = instance._read_state()
+                if state is None or state["pid"] != pid:
+                    return
+                instance.pid = pid
+                if instance._exited():
+                    instance.state_file.unlink(missing_ok=True)
+                    return
+                idle = time.time() - instance.state_file.stat().st_mtime
+                if idle >= IDLE_TIMEOUT:
+                    instance.stop()
+                    return
+        except BlockingIOError:
+            continue  # A job is running
+
+
+if __name__ == "__main__":
+    # Started by OfficeInstance.start as the watchdog of one instance
+    _watch(sys.argv[1], int(sys.argv[2]))
@@ -9,8 +9,10 @@ import sys
 import subprocess
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from openpyxl import load_workbook
+from office_pool import get_pool, pool_available, recalculate_document
 
 
 def setup_libreoffice_macro():
@@ -66,6 +68,17 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
+    # Recalculate on a warm LibreOffice instance when its Python bindings are
+    # available, otherwise run the macro in a new soffice process
+    if pool_available():
+        try:
+            get_pool().run(recalculate_document, abs_path, timeout=timeout)
+        except TimeoutError:
+            pass  # Check whatever was saved, like the timeout command below
+        except Exception as e:
+            return {'error': f'Recalculation failed: {e}'}
+        return check_errors(filename)
+    
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,6 +111,36 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return check_errors(filename)
+
+
+def recalc_all(filenames, timeout=30):
+    """
+    Recalculate several Excel files, on all pooled LibreOffice instances at once
+    
+    Args:
+        filenames: Paths to Excel files
+        timeout: Maximum time to wait for each recalculation (seconds)
+    
+    Returns:
+        dict mapping each filename to its recalc() result
+    """
+    workers = get_pool().size if pool_available() else 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda filename: recalc(filename, timeout), filenames)
+        return dict(zip(filenames, results))
+
+
+def check_errors(filename):
+    """
+    Scan a recalculated Excel file for formula errors
+    
+    Args:
+        filename: Path to Excel file
+    
+    Returns:
+        dict with error locations and counts
+    """
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)
@@ -157,7 +200,7 @@ def recalc(filename, timeout=30):
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python recalc.py <excel_file> [timeout_seconds]")
+        print("Usage: python recalc.py <excel_file>... [timeout_seconds]")
         print("\nRecalculates all formulas in an Excel file using LibreOffice")
         print("\nReturns JSON with error details:")
         print("  - status: 'success' or 'errors_found'")
@@ -167,10 +210,15 @@ def main():
         print("    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A")
         sys.exit(1)
     
-    filename = sys.argv[1]
-    timeout = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    filenames = sys.argv[1:]
+    timeout = 30
+    if len(filenames) > 1 and filenames[-1].isdigit():
+        timeout = int(filenames.pop())
     
-    result = recalc(filename, timeout)
+    if len(filenames) == 1:
+        result = recalc(filenames[0], timeout)
+    else:
+        result = recalc_all(filenames, timeout)
     print(json.dumps(result, indent=2))
 
 
@@ -15,14 +15,25 @@ import zipfile
 from pathlib import Path
 from quick_validate import validate_skill
 
+# 已經壓縮過的格式，直接儲存而不再重新壓縮
+STORED_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".mp3", ".mp4", ".mov", ".webm",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z",
+    ".docx", ".xlsx", ".pptx", ".woff", ".woff2",
+}
 
-def package_skill(skill_path, output_dir=None):
+
+def package_skill(skill_path, output_dir=None, compresslevel=None):
     """
     將 skill 資料夾打包成 zip 檔案。
 
+    已壓縮的檔案（見 STORED_EXTENSIONS）直接儲存，其餘檔案以 compresslevel 壓縮。
+
     參數：
         skill_path: skill 資料夾的路徑
         output_dir: zip 檔案的選用輸出目錄（預設為當前目錄）
+        compresslevel: deflate 壓縮等級 0-9（預設為 zlib 預設值）
 
     回傳：
         建立的 zip 檔案路徑，如果發生錯誤則為 None
@@ -71,7 +82,16 @@ def package_skill(skill_path, output_dir=None):
                 if file_path.is_file():
                     # 計算 zip 中的相對路徑
                     arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
+                    if file_path.suffix.lower() in STORED_EXTENSIONS:
+                        compress_type = zipfile.ZIP_STORED
+                    else:
+                        compress_type = zipfile.ZIP_DEFLATED
+                    zipf.write(
+                        file_path,
+                        arcname,
+                        compress_type=compress_type,
+                        compresslevel=compresslevel,
+                    )
                     print(f"  已新增：{arcname}")
 
         print(f"\n✅ 已成功將 skill 打包至：{zip_filename}")